@@ -0,0 +1,6 @@
+-- Validator headers for HTTP conditional GETs: re-scrapes send
+-- If-None-Match / If-Modified-Since and skip the body transfer entirely
+-- when the archive page is unchanged (304).
+ALTER TABLE wh.documents
+    ADD COLUMN IF NOT EXISTS etag TEXT,
+    ADD COLUMN IF NOT EXISTS last_modified TEXT;
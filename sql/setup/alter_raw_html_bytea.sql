@@ -0,0 +1,11 @@
+-- Convert raw_html to BYTEA so the scraper can store it zlib-compressed.
+-- Existing rows are kept as plain UTF-8 bytes; the Python reader helper
+-- (models.decompress_raw_html) detects whether a value is compressed.
+ALTER TABLE wh.documents
+    ALTER COLUMN raw_html TYPE BYTEA
+    USING convert_to(raw_html, 'UTF8');
+
+-- Keep the large blobs out-of-line but uncompressed by TOAST: the payload
+-- is already zlib-compressed by the writer, so recompressing wastes CPU.
+ALTER TABLE wh.documents
+    ALTER COLUMN raw_html SET STORAGE EXTERNAL;
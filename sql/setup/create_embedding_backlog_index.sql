@@ -0,0 +1,11 @@
+-- Partial index for the embedding backlog scan.
+--
+-- list_chunks_without_embeddings pages through rows with
+-- `WHERE embedding IS NULL AND id > $after ORDER BY id LIMIT $n`;
+-- this index keeps that an index-only range scan regardless of how
+-- many chunks have already been embedded.
+--
+-- CONCURRENTLY avoids blocking writers; run outside a transaction.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_chunks_pending_embedding
+    ON wh.document_chunks (id)
+    WHERE embedding IS NULL;
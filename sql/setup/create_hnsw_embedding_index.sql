@@ -0,0 +1,10 @@
+-- Replace the ivfflat ANN index with HNSW for the chunk-embedding search.
+--
+-- HNSW gives better recall/latency without the lists tuning ivfflat
+-- needs, and it does not require a training pass over existing rows.
+-- Requires pgvector >= 0.5.0.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_document_chunks_embedding_hnsw
+    ON wh.document_chunks
+    USING hnsw (embedding vector_cosine_ops);
+
+DROP INDEX CONCURRENTLY IF EXISTS wh.idx_document_chunks_embedding;
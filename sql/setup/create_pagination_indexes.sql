@@ -0,0 +1,14 @@
+-- Indexes backing the hot listing queries.
+--
+-- documents_pending_id_idx serves list_pending's
+--   WHERE scrape_status = 'pending' ORDER BY id LIMIT n
+-- from a small partial index that shrinks as the backlog drains.
+--
+-- documents_admin_status_date_idx serves the filtered, date-ordered
+-- listing query so pagination reads only the rows on the requested page.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS documents_pending_id_idx
+    ON wh.documents (id)
+    WHERE scrape_status = 'pending';
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS documents_admin_status_date_idx
+    ON wh.documents (admin, scrape_status, date_published DESC NULLS LAST, id DESC);
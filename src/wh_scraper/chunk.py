@@ -4,43 +4,81 @@ from __future__ import annotations
 
 import argparse
 import logging
-from typing import Iterable
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Iterable, Optional
 
 from .config import SETTINGS
-from .models import DocumentRepository
+from .models import DocumentForChunking, DocumentRepository
 from .vectorization import TextChunker
 
 
 LOGGER = logging.getLogger(__name__)
 
+FLUSH_EVERY_DOCUMENTS = 16
+
+_WORKER_CHUNKER: Optional[TextChunker] = None
+
+
+def _init_worker(max_tokens: int, overlap_tokens: int) -> None:
+    """Build one TextChunker per worker process so tiktoken loads once."""
+
+    global _WORKER_CHUNKER
+    _WORKER_CHUNKER = TextChunker(max_tokens=max_tokens, overlap_tokens=overlap_tokens)
+
+
+def _chunk_one(document: DocumentForChunking) -> tuple[int, Optional[str], list[str]]:
+    assert _WORKER_CHUNKER is not None
+    return document.id, document.title, _WORKER_CHUNKER.chunk_text(document.clean_text)
 
-def chunk_documents(*, limit: int) -> int:
-    repo = DocumentRepository()
-    chunker = TextChunker(
-        max_tokens=SETTINGS.chunk_max_tokens,
-        overlap_tokens=SETTINGS.chunk_overlap_tokens,
-    )
 
+def chunk_documents(*, limit: int, workers: Optional[int] = None) -> int:
+    repo = DocumentRepository()
     documents = repo.list_documents_without_chunks(limit)
-    if not documents:
-        LOGGER.info("No documents are pending chunking")
-        return 0
 
     processed = 0
-    for document in documents:
-        chunks = chunker.chunk_text(document.clean_text)
-        if not chunks:
-            LOGGER.warning("Document %s has no chunkable text, skipping", document.id)
-            continue
-
-        repo.insert_document_chunks(document_id=document.id, chunks=chunks)
-        processed += 1
-        LOGGER.info(
-            "Chunked document %s (%s) into %d chunks",
-            document.id,
-            document.title or "untitled",
-            len(chunks),
-        )
+    pending_rows: list[tuple[int, int, str]] = []
+    pending_docs = 0
+
+    with ProcessPoolExecutor(
+        max_workers=workers or os.cpu_count(),
+        initializer=_init_worker,
+        initargs=(SETTINGS.chunk_max_tokens, SETTINGS.chunk_overlap_tokens),
+    ) as executor:
+        while True:
+            batch = list(islice(documents, FLUSH_EVERY_DOCUMENTS))
+            if not batch:
+                break
+
+            for doc_id, title, chunks in executor.map(_chunk_one, batch, chunksize=2):
+                if not chunks:
+                    LOGGER.warning("Document %s has no chunkable text, skipping", doc_id)
+                    continue
+
+                pending_rows.extend(
+                    (doc_id, index, chunk) for index, chunk in enumerate(chunks)
+                )
+                pending_docs += 1
+                processed += 1
+                LOGGER.info(
+                    "Chunked document %s (%s) into %d chunks",
+                    doc_id,
+                    title or "untitled",
+                    len(chunks),
+                )
+
+            if pending_docs >= FLUSH_EVERY_DOCUMENTS:
+                repo.insert_document_chunks_bulk(pending_rows)
+                pending_rows.clear()
+                pending_docs = 0
+
+    if pending_rows:
+        repo.insert_document_chunks_bulk(pending_rows)
+
+    if not processed:
+        LOGGER.info("No documents are pending chunking")
+        return 0
 
     LOGGER.info("Chunking complete: %d documents processed", processed)
     return processed
@@ -54,6 +92,12 @@ def build_arg_parser() -> argparse.ArgumentParser:
         default=25,
         help="Maximum number of documents to chunk in this run",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of chunking worker processes (default: CPU count)",
+    )
     return parser
 
 
@@ -68,8 +112,10 @@ def main(argv: Iterable[str] | None = None) -> None:
 
     if args.limit < 1:
         parser.error("--limit must be >= 1")
+    if args.workers is not None and args.workers < 1:
+        parser.error("--workers must be >= 1")
 
-    chunk_documents(limit=args.limit)
+    chunk_documents(limit=args.limit, workers=args.workers)
 
 
 if __name__ == "__main__":
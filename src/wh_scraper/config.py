@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import os
 from dataclasses import dataclass
 from typing import Optional
@@ -9,30 +10,90 @@ from typing import Optional
 from dotenv import load_dotenv
 
 
-load_dotenv()
+def _env_int(name: str, default: int) -> int:
+    raw = os.getenv(name)
+    if not raw:
+        return default
+    try:
+        return int(raw)
+    except ValueError as exc:
+        raise ValueError(f"{name} must be an integer, got {raw!r}") from exc
+
+
+def _env_float(name: str, default: float) -> float:
+    raw = os.getenv(name)
+    if not raw:
+        return default
+    try:
+        return float(raw)
+    except ValueError as exc:
+        raise ValueError(f"{name} must be a number, got {raw!r}") from exc
 
 
 @dataclass(frozen=True)
 class Settings:
     """Holds runtime configuration derived from the environment."""
 
-    db_host: str = os.getenv("DB_HOST", "localhost")
-    db_port: int = int(os.getenv("DB_PORT", "5432"))
-    db_name: str = os.getenv("DB_NAME", "wh_briefings")
-    db_user: str = os.getenv("DB_USER", "wh_user")
-    db_password: Optional[str] = os.getenv("DB_PASSWORD") or None
+    db_host: str
+    db_port: int
+    db_name: str
+    db_user: str
+    db_password: Optional[str]
+
+    request_timeout: int
+    request_delay: float
+
+    openai_api_key: Optional[str]
+    openai_embedding_model: str
+    embedding_batch_size: int
+    embedding_concurrency: int
+    openai_relevance_model: str
+    relevance_batch_size: int
+    relevance_concurrency: int
+    relevance_token_budget: int
+    relevance_max_words: int
+    query_cache_threshold: float
+    chunk_max_tokens: int
+    chunk_overlap_tokens: int
+
+    @classmethod
+    def from_env(cls) -> "Settings":
+        load_dotenv()
+        return cls(
+            db_host=os.getenv("DB_HOST", "localhost"),
+            db_port=_env_int("DB_PORT", 5432),
+            db_name=os.getenv("DB_NAME", "wh_briefings"),
+            db_user=os.getenv("DB_USER", "wh_user"),
+            db_password=os.getenv("DB_PASSWORD") or None,
+            request_timeout=_env_int("REQUEST_TIMEOUT_SECONDS", 20),
+            request_delay=_env_float("REQUEST_DELAY_SECONDS", 1.0),
+            openai_api_key=os.getenv("OPENAI_API_KEY") or None,
+            openai_embedding_model=os.getenv(
+                "OPENAI_EMBEDDING_MODEL", "text-embedding-3-small"
+            ),
+            embedding_batch_size=_env_int("EMBEDDING_BATCH_SIZE", 64),
+            embedding_concurrency=_env_int("EMBEDDING_CONCURRENCY", 8),
+            openai_relevance_model=os.getenv("OPENAI_RELEVANCE_MODEL", "gpt-4o-mini"),
+            relevance_batch_size=_env_int("RELEVANCE_BATCH_SIZE", 5),
+            relevance_concurrency=_env_int("RELEVANCE_CONCURRENCY", 4),
+            relevance_token_budget=_env_int("RELEVANCE_TOKEN_BUDGET", 6000),
+            query_cache_threshold=_env_float("QUERY_CACHE_THRESHOLD", 0.97),
+            relevance_max_words=_env_int("RELEVANCE_MAX_WORDS", 350),
+            chunk_max_tokens=_env_int("CHUNK_MAX_TOKENS", 400),
+            chunk_overlap_tokens=_env_int("CHUNK_OVERLAP_TOKENS", 40),
+        )
+
 
-    request_timeout: int = int(os.getenv("REQUEST_TIMEOUT_SECONDS", "20"))
-    request_delay: float = float(os.getenv("REQUEST_DELAY_SECONDS", "1.0"))
+@functools.cache
+def get_settings() -> Settings:
+    """Parse the environment once, on first use."""
 
-    openai_api_key: Optional[str] = os.getenv("OPENAI_API_KEY") or None
-    openai_embedding_model: str = os.getenv("OPENAI_EMBEDDING_MODEL", "text-embedding-3-small")
-    embedding_batch_size: int = int(os.getenv("EMBEDDING_BATCH_SIZE", "64"))
-    openai_relevance_model: str = os.getenv("OPENAI_RELEVANCE_MODEL", "gpt-4o-mini")
-    relevance_batch_size: int = int(os.getenv("RELEVANCE_BATCH_SIZE", "5"))
-    relevance_max_words: int = int(os.getenv("RELEVANCE_MAX_WORDS", "350"))
-    chunk_max_tokens: int = int(os.getenv("CHUNK_MAX_TOKENS", "400"))
-    chunk_overlap_tokens: int = int(os.getenv("CHUNK_OVERLAP_TOKENS", "40"))
+    return Settings.from_env()
 
 
-SETTINGS = Settings()
+def __getattr__(name: str) -> Settings:
+    # Keep `from .config import SETTINGS` working while deferring env
+    # parsing (and any resulting errors) to first access.
+    if name == "SETTINGS":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
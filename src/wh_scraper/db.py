@@ -2,26 +2,57 @@
 
 from __future__ import annotations
 
+import threading
 from contextlib import contextmanager
 from typing import Iterator, Optional
 
 import psycopg2
-from psycopg2 import sql
+from pgvector.psycopg2 import register_vector
+from psycopg2 import pool, sql
 from psycopg2.extras import RealDictCursor
 
 from .config import SETTINGS
 
 
+_POOL: Optional[pool.ThreadedConnectionPool] = None
+_POOL_LOCK = threading.Lock()
+
+
+def _get_pool() -> pool.ThreadedConnectionPool:
+    """Return the shared connection pool, creating it on first use."""
+
+    global _POOL
+    if _POOL is None:
+        with _POOL_LOCK:
+            if _POOL is None:
+                # putconn closes any connection beyond minconn idle, so
+                # minconn must cover the expected concurrent workers
+                # (threaded scrape flushes, web workers) or most
+                # checkouts pay a fresh TCP connect.
+                _POOL = pool.ThreadedConnectionPool(
+                    minconn=16,
+                    maxconn=32,
+                    host=SETTINGS.db_host,
+                    port=SETTINGS.db_port,
+                    dbname=SETTINGS.db_name,
+                    user=SETTINGS.db_user,
+                    password=SETTINGS.db_password,
+                )
+    return _POOL
+
+
 def get_connection() -> psycopg2.extensions.connection:  # type: ignore[name-defined]
     """Create a new PostgreSQL connection using environment settings."""
 
-    return psycopg2.connect(  # type: ignore[return-value]
+    conn = psycopg2.connect(
         host=SETTINGS.db_host,
         port=SETTINGS.db_port,
         dbname=SETTINGS.db_name,
         user=SETTINGS.db_user,
         password=SETTINGS.db_password,
     )
+    register_vector(conn)
+    return conn  # type: ignore[return-value]
 
 
 @contextmanager
@@ -29,12 +60,25 @@ def get_cursor(
     *,
     commit: bool = False,
     dict_cursor: bool = False,
+    name: Optional[str] = None,
 ) -> Iterator[psycopg2.extensions.cursor]:  # type: ignore[name-defined]
-    """Yield a cursor and manage commit/rollback semantics automatically."""
+    """Yield a cursor on a pooled connection and manage commit/rollback semantics.
+
+    Passing ``name`` creates a named (server-side) cursor so large result
+    sets can be streamed in ``itersize`` batches instead of fetched at once.
+    """
 
-    conn = get_connection()
+    conn_pool = _get_pool()
+    conn = conn_pool.getconn()
+    # The pool closes surplus connections on putconn, so a checkout can
+    # hand back a brand-new connection at any time; register the pgvector
+    # adapter unconditionally rather than trying to track identity.
+    register_vector(conn)
     cursor_factory = RealDictCursor if dict_cursor else None
-    cur = conn.cursor(cursor_factory=cursor_factory)
+    if name is not None:
+        cur = conn.cursor(name=name, cursor_factory=cursor_factory)
+    else:
+        cur = conn.cursor(cursor_factory=cursor_factory)
 
     try:
         yield cur
@@ -45,8 +89,7 @@ def get_cursor(
         raise
     finally:
         cur.close()
-        conn.close()
+        conn_pool.putconn(conn)
 
 
 __all__ = ["get_connection", "get_cursor", "sql"]
-
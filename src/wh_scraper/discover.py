@@ -4,11 +4,14 @@ from __future__ import annotations
 
 import argparse
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Iterable, List
 from urllib.parse import urljoin
 
 import requests
-from bs4 import BeautifulSoup
+from lxml import html as lxml_html
+from lxml.etree import XPath
+from requests.adapters import HTTPAdapter
 
 from .models import DocumentListing, DocumentRepository
 from .utils import fetch_html, parse_date
@@ -17,13 +20,13 @@ from .utils import fetch_html, parse_date
 LOGGER = logging.getLogger(__name__)
 LISTING_ROOT = "https://bidenwhitehouse.archives.gov/briefing-room/press-briefings/"
 
-
-def _class_contains(value: object, needle: str) -> bool:
-    if isinstance(value, str):
-        return needle in value.lower()
-    if isinstance(value, (list, tuple, set)):
-        return any(isinstance(part, str) and needle in part.lower() for part in value)
-    return False
+_ARTICLE_XPATH = XPath(".//article")
+_HEADER_ANCHOR_XPATH = XPath(".//h2//a[@href] | .//h3//a[@href]")
+_TIME_XPATH = XPath(".//time")
+_DATE_FALLBACK_XPATH = XPath(
+    './/*[contains(translate(@class, "ABCDEFGHIJKLMNOPQRSTUVWXYZ",'
+    ' "abcdefghijklmnopqrstuvwxyz"), "date")]'
+)
 
 
 def build_listing_url(page: int) -> str:
@@ -33,30 +36,27 @@ def build_listing_url(page: int) -> str:
 
 
 def parse_listing(html: str) -> List[DocumentListing]:
-    soup = BeautifulSoup(html, "lxml")
-    articles = soup.select("article")
+    tree = lxml_html.fromstring(html)
     results: List[DocumentListing] = []
 
-    for article in articles:
-        header = article.find(["h2", "h3"])
-        if not header:
-            continue
-
-        anchor = header.find("a", href=True)
-        if not anchor:
+    for article in _ARTICLE_XPATH(tree):
+        anchors = _HEADER_ANCHOR_XPATH(article)
+        if not anchors:
             continue
+        anchor = anchors[0]
 
-        full_url = urljoin(LISTING_ROOT, anchor["href"].strip())
-        title = anchor.get_text(strip=True) or None
+        full_url = urljoin(LISTING_ROOT, anchor.get("href").strip())
+        title = anchor.text_content().strip() or None
 
-        time_el = article.find("time")
         date_source = None
-        if time_el:
-            date_source = time_el.get("datetime") or time_el.get_text(strip=True)
+        time_els = _TIME_XPATH(article)
+        if time_els:
+            time_el = time_els[0]
+            date_source = time_el.get("datetime") or time_el.text_content().strip()
         else:
-            date_candidate = article.find(class_=lambda c: _class_contains(c, "date"))
-            if date_candidate:
-                date_source = date_candidate.get_text(strip=True)
+            date_candidates = _DATE_FALLBACK_XPATH(article)
+            if date_candidates:
+                date_source = date_candidates[0].text_content().strip()
 
         results.append(
             DocumentListing(
@@ -69,32 +69,41 @@ def parse_listing(html: str) -> List[DocumentListing]:
     return results
 
 
-def discover(*, start_page: int, end_page: int) -> int:
+def discover(*, start_page: int, end_page: int, concurrency: int = 8) -> int:
     repo = DocumentRepository()
     session = requests.Session()
-    total_records = 0
+    adapter = HTTPAdapter(pool_connections=concurrency, pool_maxsize=concurrency)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
 
-    for page in range(start_page, end_page + 1):
-        listing_url = build_listing_url(page)
-        LOGGER.info("Fetching listing page %s", listing_url)
+    all_listings: List[DocumentListing] = []
 
-        try:
-            html = fetch_html(listing_url, session=session)
-        except requests.RequestException as exc:  # pragma: no cover - network error path
-            LOGGER.error("Failed to fetch %s: %s", listing_url, exc)
-            continue
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        futures = {
+            executor.submit(fetch_html, build_listing_url(page), session=session): page
+            for page in range(start_page, end_page + 1)
+        }
 
-        listings = parse_listing(html)
-        if not listings:
-            LOGGER.warning("No listings found for %s", listing_url)
-            continue
+        for future in as_completed(futures):
+            page = futures[future]
+            listing_url = build_listing_url(page)
+            try:
+                html = future.result()
+            except requests.RequestException as exc:  # pragma: no cover - network error path
+                LOGGER.error("Failed to fetch %s: %s", listing_url, exc)
+                continue
 
-        repo.upsert_listings(listings)
-        total_records += len(listings)
-        LOGGER.info("Processed %d listings from page %d", len(listings), page)
+            listings = parse_listing(html)
+            if not listings:
+                LOGGER.warning("No listings found for %s", listing_url)
+                continue
 
-    LOGGER.info("Completed discover run: %d records touched", total_records)
-    return total_records
+            all_listings.extend(listings)
+            LOGGER.info("Processed %d listings from page %d", len(listings), page)
+
+    repo.upsert_listings(all_listings)
+    LOGGER.info("Completed discover run: %d records touched", len(all_listings))
+    return len(all_listings)
 
 
 def build_arg_parser() -> argparse.ArgumentParser:
@@ -106,6 +115,12 @@ def build_arg_parser() -> argparse.ArgumentParser:
         default=116,
         help="Last listing page to crawl (inclusive)",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=8,
+        help="Number of listing pages to fetch in parallel",
+    )
     return parser
 
 
@@ -122,8 +137,14 @@ def main(argv: Iterable[str] | None = None) -> None:
         parser.error("--start-page must be >= 1")
     if args.end_page < args.start_page:
         parser.error("--end-page must be >= --start-page")
+    if args.concurrency < 1:
+        parser.error("--concurrency must be >= 1")
 
-    discover(start_page=args.start_page, end_page=args.end_page)
+    discover(
+        start_page=args.start_page,
+        end_page=args.end_page,
+        concurrency=args.concurrency,
+    )
 
 
 if __name__ == "__main__":
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
 import logging
 from typing import Iterable, List
 
@@ -12,38 +13,42 @@ from .vectorization import OpenAIEmbeddingClient
 
 LOGGER = logging.getLogger(__name__)
 
+FETCH_BATCH_SIZE = 200
+
 
 def embed_pending_chunks(*, limit: int) -> int:
     repo = DocumentRepository()
-    pending_chunks = repo.list_chunks_without_embeddings(limit)
-    if not pending_chunks:
-        LOGGER.info("No chunks awaiting embeddings")
-        return 0
-
-    client = OpenAIEmbeddingClient()
+    client: OpenAIEmbeddingClient | None = None
     total_updated = 0
-    texts: List[str] = [chunk.text for chunk in pending_chunks]
+    after_id = 0
 
-    try:
-        batch = client.embed_in_batches(texts)
-    except Exception as exc:  # pragma: no cover - network path
-        LOGGER.error("Embedding API error: %s", exc)
-        return 0
+    while total_updated < limit:
+        batch_limit = min(FETCH_BATCH_SIZE, limit - total_updated)
+        pending_chunks = repo.list_chunks_without_embeddings(batch_limit, after_id=after_id)
+        if not pending_chunks:
+            break
+
+        if client is None:
+            client = OpenAIEmbeddingClient()
 
-    for chunk, vector in zip(pending_chunks, batch.vectors):
-        repo.update_chunk_embedding(
-            chunk_id=chunk.id,
-            embedding=vector,
-            embedding_model=batch.model,
-            embedding_dimensions=batch.dimensions,
-        )
-        total_updated += 1
-        LOGGER.debug(
-            "Stored embedding for chunk %s (document %s, index %s)",
-            chunk.id,
-            chunk.document_id,
-            chunk.chunk_index,
-        )
+        texts: List[str] = [chunk.text for chunk in pending_chunks]
+
+        try:
+            batch = asyncio.run(client.embed_in_batches_async(texts))
+        except Exception as exc:  # pragma: no cover - network path
+            LOGGER.error("Embedding API error: %s", exc)
+            break
+
+        updates = [
+            (chunk.id, vector, batch.model, batch.dimensions)
+            for chunk, vector in zip(pending_chunks, batch.vectors)
+        ]
+        total_updated += repo.update_chunk_embeddings_bulk(updates)
+        after_id = pending_chunks[-1].id
+
+    if not total_updated:
+        LOGGER.info("No chunks awaiting embeddings")
+        return 0
 
     LOGGER.info("Embedded %d chunks", total_updated)
     return total_updated
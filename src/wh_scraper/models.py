@@ -2,16 +2,81 @@
 
 from __future__ import annotations
 
+import io
+import operator
+import queue
+import threading
+import time
+import zlib
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import date, datetime
-from typing import Iterable, List, Optional, Sequence
+from typing import Iterable, Iterator, List, Optional, Sequence
 
+import numpy as np
+import psycopg2
 from psycopg2.extras import execute_values
 
 from .db import get_cursor
 
 
-@dataclass
+@contextmanager
+def _write_cursor(
+    cur: Optional[psycopg2.extensions.cursor],  # type: ignore[name-defined]
+) -> Iterator[psycopg2.extensions.cursor]:  # type: ignore[name-defined]
+    """Reuse a caller-supplied cursor, or open a fresh auto-committing one.
+
+    Passing an explicit cursor lets callers batch many writes into a single
+    connection and transaction; the commit then happens when the caller's
+    own `get_cursor(commit=True)` context exits.
+    """
+
+    if cur is not None:
+        yield cur
+    else:
+        with get_cursor(commit=True) as owned:
+            yield owned
+
+
+# COPY TEXT format: NULL is \N, and backslash/tab/newline must be escaped
+# inside field values.
+_COPY_ESCAPES = str.maketrans(
+    {"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"}
+)
+
+
+def _copy_field(value: object) -> str:
+    if value is None:
+        return "\\N"
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    if isinstance(value, (bytes, memoryview)):
+        # bytea hex input, with the leading backslash escaped for COPY TEXT.
+        return "\\\\x" + bytes(value).hex()
+    return str(value).translate(_COPY_ESCAPES)
+
+
+def _compress_raw_html(raw_html: Optional[str]) -> Optional[bytes]:
+    """Compress raw page HTML for storage in the bytea column."""
+
+    if raw_html is None:
+        return None
+    return zlib.compress(raw_html.encode("utf-8"), 6)
+
+
+def decompress_raw_html(blob: Optional[bytes]) -> Optional[str]:
+    """Inverse of `_compress_raw_html`, tolerating pre-compression rows."""
+
+    if blob is None:
+        return None
+    data = bytes(blob)
+    try:
+        return zlib.decompress(data).decode("utf-8")
+    except zlib.error:
+        return data.decode("utf-8")
+
+
+@dataclass(slots=True)
 class DocumentListing:
     """Represents a normalized entry discovered from the listing pages."""
 
@@ -23,15 +88,17 @@ class DocumentListing:
     content_type: str = "press_briefing"
 
 
-@dataclass
+@dataclass(slots=True)
 class DocumentPending:
     """Represents a pending row that still needs scraping."""
 
     id: int
     url: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DocumentSummary:
     """Lightweight projection for listing documents."""
 
@@ -42,7 +109,7 @@ class DocumentSummary:
     scrape_status: str
 
 
-@dataclass
+@dataclass(slots=True)
 class DocumentDetail:
     """Full information needed to render a document page."""
 
@@ -57,66 +124,345 @@ class DocumentDetail:
     scrape_status: str
 
 
+# Lowers the per-row attribute fetches in upsert_listings into one C call.
+_LISTING_GET = operator.attrgetter(
+    "admin", "source_site", "content_type", "url", "title", "date_published"
+)
+
+
+# Static statements are built once at import time so each call reuses the
+# same SQL string instead of reassembling it per invocation.
+_UPSERT_LISTINGS_SQL = """
+    INSERT INTO wh.documents (
+        admin,
+        source_site,
+        content_type,
+        url,
+        title,
+        date_published,
+        scrape_status
+    ) VALUES %s
+    ON CONFLICT (url) DO UPDATE SET
+        title = EXCLUDED.title,
+        date_published = EXCLUDED.date_published,
+        updated_at = NOW()
+    WHERE wh.documents.title IS DISTINCT FROM EXCLUDED.title
+       OR wh.documents.date_published IS DISTINCT FROM EXCLUDED.date_published;
+"""
+
+_LIST_PENDING_SQL = """
+    SELECT id, url, etag, last_modified
+    FROM wh.documents
+    WHERE scrape_status = 'pending'
+    ORDER BY id
+    LIMIT %s;
+"""
+
+_ITER_PENDING_SQL = """
+    SELECT id, url, etag, last_modified
+    FROM wh.documents
+    WHERE scrape_status = 'pending'
+    ORDER BY id;
+"""
+
+_MARK_SCRAPED_SQL = """
+    UPDATE wh.documents
+    SET
+        title = COALESCE(%s, title),
+        date_published = %s,
+        datetime_published = %s,
+        location = %s,
+        raw_html = %s,
+        clean_text = %s,
+        etag = %s,
+        last_modified = %s,
+        scrape_status = 'scraped',
+        last_error = NULL,
+        updated_at = NOW()
+    WHERE id = %s;
+"""
+
+_MARK_UNCHANGED_SQL = """
+    UPDATE wh.documents
+    SET
+        scrape_status = 'scraped',
+        last_error = NULL,
+        updated_at = NOW()
+    WHERE id = ANY(%s);
+"""
+
+_MARK_ERROR_SQL = """
+    UPDATE wh.documents
+    SET
+        scrape_status = 'error',
+        last_error = %s,
+        updated_at = NOW()
+    WHERE id = %s;
+"""
+
+# mark_scraped_bulk stages rows through COPY: raw_html/clean_text blobs go
+# over the wire as one COPY stream instead of N parameterized UPDATEs, and
+# the server applies them with a single UPDATE ... FROM. IF NOT EXISTS +
+# TRUNCATE keeps repeated flushes on one caller-held cursor working; ON
+# COMMIT DROP only fires at commit.
+_CREATE_SCRAPED_STAGE_SQL = """
+    CREATE TEMP TABLE IF NOT EXISTS tmp_scraped (
+        id BIGINT,
+        title TEXT,
+        date_published DATE,
+        datetime_published TIMESTAMPTZ,
+        location TEXT,
+        raw_html BYTEA,
+        clean_text TEXT,
+        etag TEXT,
+        last_modified TEXT
+    ) ON COMMIT DROP;
+    TRUNCATE tmp_scraped;
+"""
+
+_COPY_SCRAPED_STAGE_SQL = "COPY tmp_scraped FROM STDIN WITH (FORMAT TEXT)"
+
+_APPLY_SCRAPED_STAGE_SQL = """
+    UPDATE wh.documents AS d SET
+        title = COALESCE(t.title, d.title),
+        date_published = t.date_published,
+        datetime_published = t.datetime_published,
+        location = t.location,
+        raw_html = t.raw_html,
+        clean_text = t.clean_text,
+        etag = t.etag,
+        last_modified = t.last_modified,
+        scrape_status = 'scraped',
+        last_error = NULL,
+        updated_at = NOW()
+    FROM tmp_scraped t
+    WHERE d.id = t.id;
+"""
+
+_MARK_ERROR_BULK_SQL = """
+    UPDATE wh.documents AS d SET
+        scrape_status = 'error',
+        last_error = v.error,
+        updated_at = NOW()
+    FROM (VALUES %s) AS v(id, error)
+    WHERE d.id = v.id;
+"""
+
+_GET_DOCUMENT_SQL = """
+    SELECT
+        id,
+        admin,
+        title,
+        url,
+        date_published,
+        datetime_published,
+        location,
+        clean_text,
+        scrape_status
+    FROM wh.documents
+    WHERE id = %s;
+"""
+
+_DOCS_WITHOUT_CHUNKS_SQL = """
+    SELECT
+        d.id,
+        d.title
+    FROM wh.documents d
+    LEFT JOIN wh.document_chunks c ON c.document_id = d.id
+    WHERE d.clean_text IS NOT NULL
+      AND d.clean_text <> ''
+      AND c.document_id IS NULL
+    ORDER BY d.id
+    LIMIT %s;
+"""
+
+_FETCH_CLEAN_TEXT_SQL = """
+    SELECT clean_text
+    FROM wh.documents
+    WHERE id = %s;
+"""
+
+_INSERT_CHUNKS_SQL = """
+    INSERT INTO wh.document_chunks (document_id, chunk_index, text)
+    VALUES %s
+    ON CONFLICT (document_id, chunk_index) DO UPDATE SET
+        text = EXCLUDED.text,
+        embedding = NULL,
+        embedding_model = NULL,
+        embedding_dimensions = NULL,
+        embedding_updated_at = NULL,
+        updated_at = NOW();
+"""
+
+_INSERT_CHUNKS_WITH_EMBEDDINGS_SQL = """
+    INSERT INTO wh.document_chunks (
+        document_id,
+        chunk_index,
+        text,
+        embedding,
+        embedding_model,
+        embedding_dimensions,
+        embedding_updated_at
+    )
+    VALUES %s
+    ON CONFLICT (document_id, chunk_index) DO UPDATE SET
+        text = EXCLUDED.text,
+        embedding = EXCLUDED.embedding,
+        embedding_model = EXCLUDED.embedding_model,
+        embedding_dimensions = EXCLUDED.embedding_dimensions,
+        embedding_updated_at = NOW(),
+        updated_at = NOW();
+"""
+
+_CHUNKS_WITHOUT_EMBEDDINGS_SQL = """
+    SELECT
+        id,
+        document_id,
+        chunk_index,
+        text
+    FROM wh.document_chunks
+    WHERE embedding IS NULL
+      AND id > %s
+    ORDER BY id
+    LIMIT %s;
+"""
+
+_UPDATE_CHUNK_EMBEDDING_SQL = """
+    UPDATE wh.document_chunks
+    SET
+        embedding = %s,
+        embedding_model = %s,
+        embedding_dimensions = %s,
+        embedding_updated_at = NOW(),
+        updated_at = NOW()
+    WHERE id = %s;
+"""
+
+_UPDATE_CHUNK_EMBEDDINGS_BULK_SQL = """
+    UPDATE wh.document_chunks AS c SET
+        embedding = v.emb,
+        embedding_model = v.model,
+        embedding_dimensions = v.dim,
+        embedding_updated_at = NOW(),
+        updated_at = NOW()
+    FROM (VALUES %s) AS v(id, emb, model, dim)
+    WHERE c.id = v.id;
+"""
+
+
+# The DISTINCT admin/status lists change roughly once per backfill, so the
+# UI filter dropdowns are served from a short-lived in-process cache that
+# writes invalidate.
+_DISTINCT_CACHE_TTL_SECONDS = 60.0
+_DISTINCT_CACHE: dict[str, tuple[float, List[str]]] = {}
+
+
+def _invalidate_distinct_cache() -> None:
+    _DISTINCT_CACHE.clear()
+
+
 class DocumentRepository:
     """Encapsulates reads/writes to the `wh.documents` table."""
 
-    @staticmethod
-    def _vector_literal(values: Sequence[float]) -> str:
-        formatted = ", ".join(f"{value:.8f}" for value in values)
-        return f"[{formatted}]"
+    @contextmanager
+    def cursor(self) -> Iterator[psycopg2.extensions.cursor]:  # type: ignore[name-defined]
+        """Check out one pooled connection for several writes in one transaction.
+
+        Pass the yielded cursor as `cur=` to the write methods below; the
+        commit happens when this context exits.
+        """
 
-    def upsert_listings(self, rows: Sequence[DocumentListing]) -> int:
+        with get_cursor(commit=True) as cur:
+            yield cur
+
+    def upsert_listings(
+        self,
+        rows: Sequence[DocumentListing],
+        *,
+        cur: Optional[psycopg2.extensions.cursor] = None,  # type: ignore[name-defined]
+    ) -> int:
         if not rows:
             return 0
 
-        values = [
-            (
-                row.admin,
-                row.source_site,
-                row.content_type,
-                row.url,
-                row.title,
-                row.date_published,
-                "pending",
-            )
-            for row in rows
-        ]
+        # Dedupe on URL (last listing wins): ON CONFLICT DO UPDATE rejects
+        # batches that touch the same row twice, and listing pages overlap
+        # at page boundaries.
+        deduped = {row.url: row for row in rows}
 
-        insert_sql = """
-            INSERT INTO wh.documents (
-                admin,
-                source_site,
-                content_type,
-                url,
-                title,
-                date_published,
-                scrape_status
-            ) VALUES %s
-            ON CONFLICT (url) DO UPDATE SET
-                title = EXCLUDED.title,
-                date_published = EXCLUDED.date_published,
-                updated_at = NOW();
-        """
+        values = [(*_LISTING_GET(row), "pending") for row in deduped.values()]
 
-        with get_cursor(commit=True) as cur:
-            execute_values(cur, insert_sql, values)
+        with _write_cursor(cur) as target:
+            execute_values(target, _UPSERT_LISTINGS_SQL, values)
 
-        return len(rows)
+        _invalidate_distinct_cache()
+        return len(values)
 
     def list_pending(self, limit: int) -> List[DocumentPending]:
-        query = """
-            SELECT id, url
-            FROM wh.documents
-            WHERE scrape_status = 'pending'
-            ORDER BY id
-            LIMIT %s;
-        """
-
-        with get_cursor(dict_cursor=True) as cur:
-            cur.execute(query, (limit,))
+        with get_cursor() as cur:
+            cur.execute(_LIST_PENDING_SQL, (limit,))
             rows = cur.fetchall()
 
-        return [DocumentPending(id=row["id"], url=row["url"]) for row in rows]
+        return [
+            DocumentPending(id=row[0], url=row[1], etag=row[2], last_modified=row[3])
+            for row in rows
+        ]
+
+    def iter_pending(
+        self,
+        *,
+        batch_size: int = 100,
+        limit: Optional[int] = None,
+    ) -> Iterator[List[DocumentPending]]:
+        """Yield batches of pending documents with one batch of lookahead.
+
+        A background thread streams rows off a server-side cursor and keeps
+        the next batch queued, so callers that fetch/parse/write a batch
+        never stall on the listing query between batches.
+        """
+
+        batches: queue.Queue[Optional[List[DocumentPending]]] = queue.Queue(maxsize=2)
+        failure: List[BaseException] = []
+
+        def _produce() -> None:
+            try:
+                with get_cursor(name="pending_cur") as cur:
+                    cur.itersize = batch_size
+                    if limit is None:
+                        cur.execute(_ITER_PENDING_SQL)
+                    else:
+                        cur.execute(_LIST_PENDING_SQL, (limit,))
+                    while True:
+                        rows = cur.fetchmany(batch_size)
+                        if not rows:
+                            break
+                        batches.put(
+                            [
+                                DocumentPending(
+                                    id=row[0],
+                                    url=row[1],
+                                    etag=row[2],
+                                    last_modified=row[3],
+                                )
+                                for row in rows
+                            ]
+                        )
+            except BaseException as exc:  # propagate to the consumer
+                failure.append(exc)
+            finally:
+                batches.put(None)
+
+        producer = threading.Thread(target=_produce, daemon=True)
+        producer.start()
+
+        while True:
+            batch = batches.get()
+            if batch is None:
+                break
+            yield batch
+
+        producer.join()
+        if failure:
+            raise failure[0]
 
     def mark_scraped(
         self,
@@ -128,48 +474,119 @@ class DocumentRepository:
         location: Optional[str],
         raw_html: str,
         clean_text: str,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        cur: Optional[psycopg2.extensions.cursor] = None,  # type: ignore[name-defined]
     ) -> None:
-        query = """
-            UPDATE wh.documents
-            SET
-                title = COALESCE(%s, title),
-                date_published = %s,
-                datetime_published = %s,
-                location = %s,
-                raw_html = %s,
-                clean_text = %s,
-                scrape_status = 'scraped',
-                last_error = NULL,
-                updated_at = NOW()
-            WHERE id = %s;
-        """
-
-        with get_cursor(commit=True) as cur:
-            cur.execute(
-                query,
+        with _write_cursor(cur) as target:
+            target.execute(
+                _MARK_SCRAPED_SQL,
                 (
                     title,
                     date_published,
                     datetime_published,
                     location,
-                    raw_html,
+                    psycopg2.Binary(_compress_raw_html(raw_html)),
                     clean_text,
+                    etag,
+                    last_modified,
                     document_id,
                 ),
             )
+        _invalidate_distinct_cache()
 
-    def mark_error(self, *, document_id: int, error: str) -> None:
-        query = """
-            UPDATE wh.documents
-            SET
-                scrape_status = 'error',
-                last_error = %s,
-                updated_at = NOW()
-            WHERE id = %s;
-        """
+    def mark_scraped_bulk(
+        self,
+        rows: Sequence[dict],
+        *,
+        cur: Optional[psycopg2.extensions.cursor] = None,  # type: ignore[name-defined]
+    ) -> int:
+        """Apply many parsed results at once; `rows` use mark_scraped's keyword names."""
 
-        with get_cursor(commit=True) as cur:
-            cur.execute(query, (error[:1024], document_id))
+        if not rows:
+            return 0
+
+        buffer = io.StringIO()
+        for row in rows:
+            buffer.write(
+                "\t".join(
+                    _copy_field(value)
+                    for value in (
+                        row["document_id"],
+                        row["title"],
+                        row["date_published"],
+                        row["datetime_published"],
+                        row["location"],
+                        _compress_raw_html(row["raw_html"]),
+                        row["clean_text"],
+                        row.get("etag"),
+                        row.get("last_modified"),
+                    )
+                )
+            )
+            buffer.write("\n")
+        buffer.seek(0)
+
+        with _write_cursor(cur) as target:
+            target.execute(_CREATE_SCRAPED_STAGE_SQL)
+            target.copy_expert(_COPY_SCRAPED_STAGE_SQL, buffer)
+            target.execute(_APPLY_SCRAPED_STAGE_SQL)
+
+        _invalidate_distinct_cache()
+        return len(rows)
+
+    def mark_unchanged_bulk(
+        self,
+        ids: Sequence[int],
+        *,
+        cur: Optional[psycopg2.extensions.cursor] = None,  # type: ignore[name-defined]
+    ) -> int:
+        """Flip 304-not-modified documents back to scraped, content untouched."""
+
+        if not ids:
+            return 0
+
+        with _write_cursor(cur) as target:
+            target.execute(_MARK_UNCHANGED_SQL, (list(ids),))
+
+        _invalidate_distinct_cache()
+        return len(ids)
+
+    def mark_error_bulk(
+        self,
+        rows: Sequence[tuple[int, str]],
+        *,
+        cur: Optional[psycopg2.extensions.cursor] = None,  # type: ignore[name-defined]
+    ) -> int:
+        """Record `(document_id, error)` failures for many documents at once."""
+
+        if not rows:
+            return 0
+
+        values = [(document_id, error[:1024]) for document_id, error in rows]
+
+        with _write_cursor(cur) as target:
+            execute_values(
+                target,
+                _MARK_ERROR_BULK_SQL,
+                values,
+                template="(%s, %s)",
+                page_size=100,
+            )
+
+        _invalidate_distinct_cache()
+        return len(values)
+
+    def mark_error(
+        self,
+        *,
+        document_id: int,
+        error: str,
+        cur: Optional[psycopg2.extensions.cursor] = None,  # type: ignore[name-defined]
+    ) -> None:
+        with _write_cursor(cur) as target:
+            target.execute(_MARK_ERROR_SQL, (error[:1024], document_id))
+        _invalidate_distinct_cache()
 
     def list_documents(
         self,
@@ -178,7 +595,19 @@ class DocumentRepository:
         scrape_status: Optional[str],
         limit: int,
         offset: int = 0,
+        after_date: Optional[date] = None,
+        after_id: Optional[int] = None,
     ) -> List[DocumentSummary]:
+        """List documents, newest first.
+
+        Prefer keyset pagination (`after_date`/`after_id` from the last row
+        of the previous page) over `offset`: the row-comparison predicate
+        stays O(limit) however deep the caller pages. Pass the previous
+        page's last `date_published` as `after_date` — including None once
+        the cursor reaches the undated tail that NULLS LAST sorts to the
+        end.
+        """
+
         base_query = [
             """
             SELECT id, admin, title, date_published, scrape_status
@@ -194,13 +623,31 @@ class DocumentRepository:
         if scrape_status:
             conditions.append("scrape_status = %s")
             params.append(scrape_status)
+        if after_id is not None:
+            # Row comparison against a NULL date_published yields NULL, so
+            # the undated tail that NULLS LAST orders to the end would be
+            # unreachable without the explicit IS NULL arm. A dated cursor
+            # therefore also admits the whole tail; once the cursor row
+            # itself is undated, only smaller ids in that tail remain.
+            if after_date is not None:
+                conditions.append(
+                    "((date_published, id) < (%s, %s) OR date_published IS NULL)"
+                )
+                params.extend([after_date, after_id])
+            else:
+                conditions.append("(date_published IS NULL AND id < %s)")
+                params.append(after_id)
 
         if conditions:
             base_query.append("WHERE " + " AND ".join(conditions))
 
         base_query.append("ORDER BY date_published DESC NULLS LAST, id DESC")
-        base_query.append("LIMIT %s OFFSET %s")
-        params.extend([limit, offset])
+        if after_id is not None:
+            base_query.append("LIMIT %s")
+            params.append(limit)
+        else:
+            base_query.append("LIMIT %s OFFSET %s")
+            params.extend([limit, offset])
 
         query = "\n".join(base_query)
 
@@ -219,13 +666,80 @@ class DocumentRepository:
             for row in rows
         ]
 
-    def count_documents(
+    def iter_documents(
+        self,
+        *,
+        admin: Optional[str] = None,
+        scrape_status: Optional[str] = None,
+        limit: Optional[int] = None,
+        itersize: int = 500,
+    ) -> Iterator[DocumentSummary]:
+        """Stream document summaries, newest first.
+
+        Rows come off a named server-side cursor in `itersize` batches, so
+        peak memory is bounded regardless of how many documents match.
+        """
+
+        base_query = [
+            """
+            SELECT id, admin, title, date_published, scrape_status
+            FROM wh.documents
+            """
+        ]
+        conditions = []
+        params: List[object] = []
+
+        if admin:
+            conditions.append("admin = %s")
+            params.append(admin)
+        if scrape_status:
+            conditions.append("scrape_status = %s")
+            params.append(scrape_status)
+
+        if conditions:
+            base_query.append("WHERE " + " AND ".join(conditions))
+
+        base_query.append("ORDER BY date_published DESC NULLS LAST, id DESC")
+        if limit is not None:
+            base_query.append("LIMIT %s")
+            params.append(limit)
+
+        query = "\n".join(base_query)
+
+        with get_cursor(dict_cursor=True, name="list_docs") as cur:
+            cur.itersize = itersize
+            cur.execute(query, params)
+            for row in cur:
+                yield DocumentSummary(
+                    id=row["id"],
+                    admin=row["admin"],
+                    title=row["title"],
+                    date_published=row["date_published"],
+                    scrape_status=row["scrape_status"],
+                )
+
+    def list_documents_with_count(
         self,
         *,
         admin: Optional[str],
         scrape_status: Optional[str],
-    ) -> int:
-        query = ["SELECT COUNT(*) FROM wh.documents"]
+        limit: int,
+        offset: int = 0,
+    ) -> tuple[List[DocumentSummary], int]:
+        """Return one page of documents plus the filtered total in one query.
+
+        `COUNT(*) OVER ()` attaches the total to every row, so rendering a
+        listing page costs a single round-trip instead of a list + count
+        pair with identical filters.
+        """
+
+        base_query = [
+            """
+            SELECT id, admin, title, date_published, scrape_status,
+                   COUNT(*) OVER () AS total_count
+            FROM wh.documents
+            """
+        ]
         conditions = []
         params: List[object] = []
 
@@ -237,48 +751,58 @@ class DocumentRepository:
             params.append(scrape_status)
 
         if conditions:
-            query.append("WHERE " + " AND ".join(conditions))
+            base_query.append("WHERE " + " AND ".join(conditions))
 
-        sql_query = "\n".join(query)
+        base_query.append("ORDER BY date_published DESC NULLS LAST, id DESC")
+        base_query.append("LIMIT %s OFFSET %s")
+        params.extend([limit, offset])
 
-        with get_cursor() as cur:
-            cur.execute(sql_query, params or None)
-            (total,) = cur.fetchone()
+        query = "\n".join(base_query)
+
+        with get_cursor(dict_cursor=True) as cur:
+            cur.execute(query, params)
+            rows = cur.fetchall()
 
-        return total
+        if not rows:
+            return [], 0
+
+        documents = [
+            DocumentSummary(
+                id=row["id"],
+                admin=row["admin"],
+                title=row["title"],
+                date_published=row["date_published"],
+                scrape_status=row["scrape_status"],
+            )
+            for row in rows
+        ]
+        return documents, rows[0]["total_count"]
+
+    def _list_distinct(self, key: str, query: str) -> List[str]:
+        now = time.monotonic()
+        cached = _DISTINCT_CACHE.get(key)
+        if cached is not None and cached[0] > now:
+            return cached[1]
 
-    def list_admins(self) -> List[str]:
-        query = "SELECT DISTINCT admin FROM wh.documents ORDER BY admin;"
         with get_cursor() as cur:
             cur.execute(query)
             rows = cur.fetchall()
-        return [row[0] for row in rows]
+
+        values = [row[0] for row in rows]
+        _DISTINCT_CACHE[key] = (now + _DISTINCT_CACHE_TTL_SECONDS, values)
+        return values
+
+    def list_admins(self) -> List[str]:
+        query = "SELECT DISTINCT admin FROM wh.documents ORDER BY admin;"
+        return self._list_distinct("admin", query)
 
     def list_statuses(self) -> List[str]:
         query = "SELECT DISTINCT scrape_status FROM wh.documents ORDER BY scrape_status;"
-        with get_cursor() as cur:
-            cur.execute(query)
-            rows = cur.fetchall()
-        return [row[0] for row in rows]
+        return self._list_distinct("scrape_status", query)
 
     def get_document(self, document_id: int) -> Optional[DocumentDetail]:
-        query = """
-            SELECT
-                id,
-                admin,
-                title,
-                url,
-                date_published,
-                datetime_published,
-                location,
-                clean_text,
-                scrape_status
-            FROM wh.documents
-            WHERE id = %s;
-        """
-
         with get_cursor(dict_cursor=True) as cur:
-            cur.execute(query, (document_id,))
+            cur.execute(_GET_DOCUMENT_SQL, (document_id,))
             row = cur.fetchone()
 
         if not row:
@@ -296,88 +820,104 @@ class DocumentRepository:
             scrape_status=row["scrape_status"],
         )
 
-    def list_documents_without_chunks(self, limit: int) -> List[DocumentForChunking]:
-        query = """
-            SELECT
-                d.id,
-                d.title,
-                d.clean_text
-            FROM wh.documents d
-            WHERE d.clean_text IS NOT NULL
-              AND d.clean_text <> ''
-              AND NOT EXISTS (
-                  SELECT 1 FROM wh.document_chunks c WHERE c.document_id = d.id
-              )
-            ORDER BY d.id
-            LIMIT %s;
-        """
+    def fetch_clean_text(self, document_id: int) -> str:
+        with get_cursor() as cur:
+            cur.execute(_FETCH_CLEAN_TEXT_SQL, (document_id,))
+            row = cur.fetchone()
+        return row[0] if row and row[0] else ""
 
-        with get_cursor(dict_cursor=True) as cur:
-            cur.execute(query, (limit,))
-            rows = cur.fetchall()
+    def list_documents_without_chunks(self, limit: int) -> Iterator[DocumentForChunking]:
+        """Stream documents pending chunking via a server-side cursor.
 
-        return [
-            DocumentForChunking(
-                id=row["id"],
-                title=row["title"],
-                clean_text=row["clean_text"],
-            )
-            for row in rows
-        ]
+        The scan itself only carries (id, title); `clean_text` can run to
+        hundreds of KB per row, so it is fetched one document at a time as
+        each row is consumed rather than materialized in cursor batches.
+        """
+
+        with get_cursor(name="docs_for_chunking") as cur:
+            cur.itersize = 32
+            cur.execute(_DOCS_WITHOUT_CHUNKS_SQL, (limit,))
+            for doc_id, title in cur:
+                yield DocumentForChunking(
+                    id=doc_id,
+                    title=title,
+                    clean_text=self.fetch_clean_text(doc_id),
+                )
 
     def insert_document_chunks(self, *, document_id: int, chunks: Sequence[str]) -> int:
-        if not chunks:
+        rows = [(document_id, index, chunk) for index, chunk in enumerate(chunks)]
+        return self.insert_document_chunks_bulk(rows)
+
+    def insert_document_chunks_bulk(
+        self,
+        rows: Sequence[tuple[int, int, str]],
+        *,
+        cur: Optional[psycopg2.extensions.cursor] = None,  # type: ignore[name-defined]
+    ) -> int:
+        """Insert `(document_id, chunk_index, text)` rows across documents in one statement."""
+
+        if not rows:
             return 0
 
-        values = [
-            (
-                document_id,
-                index,
-                chunk,
+        with _write_cursor(cur) as target:
+            execute_values(
+                target,
+                _INSERT_CHUNKS_SQL,
+                rows,
+                template="(%s, %s, %s)",
+                page_size=1000,
             )
-            for index, chunk in enumerate(chunks)
-        ]
 
-        insert_sql = """
-            INSERT INTO wh.document_chunks (document_id, chunk_index, text)
-            VALUES %s
-            ON CONFLICT (document_id, chunk_index) DO UPDATE SET
-                text = EXCLUDED.text,
-                embedding = NULL,
-                embedding_model = NULL,
-                embedding_dimensions = NULL,
-                embedding_updated_at = NULL,
-                updated_at = NOW();
+        return len(rows)
+
+    def insert_document_chunks_with_embeddings(
+        self,
+        rows: Sequence[tuple[int, int, str, Sequence[float], str, int]],
+        *,
+        cur: Optional[psycopg2.extensions.cursor] = None,  # type: ignore[name-defined]
+    ) -> int:
+        """Insert `(document_id, chunk_index, text, embedding, model, dims)` rows.
+
+        Used by the fused pipeline so a chunk and its embedding land in a
+        single write instead of an insert followed by an update.
         """
 
-        with get_cursor(commit=True) as cur:
-            execute_values(cur, insert_sql, values)
+        if not rows:
+            return 0
+
+        values = [
+            (doc_id, index, text, np.asarray(vector, dtype=np.float32), model, dims)
+            for doc_id, index, text, vector, model, dims in rows
+        ]
+
+        with _write_cursor(cur) as target:
+            execute_values(
+                target,
+                _INSERT_CHUNKS_WITH_EMBEDDINGS_SQL,
+                values,
+                template="(%s, %s, %s, %s, %s, %s, NOW())",
+                page_size=500,
+            )
 
         return len(values)
 
-    def list_chunks_without_embeddings(self, limit: int) -> List[ChunkForEmbedding]:
-        query = """
-            SELECT
-                id,
-                document_id,
-                chunk_index,
-                text
-            FROM wh.document_chunks
-            WHERE embedding IS NULL
-            ORDER BY id
-            LIMIT %s;
-        """
+    def list_chunks_without_embeddings(
+        self,
+        limit: int,
+        after_id: int = 0,
+    ) -> List[ChunkForEmbedding]:
+        """Fetch pending chunks with ids greater than `after_id` (keyset pagination)."""
 
-        with get_cursor(dict_cursor=True) as cur:
-            cur.execute(query, (limit,))
+        with get_cursor() as cur:
+            cur.execute(_CHUNKS_WITHOUT_EMBEDDINGS_SQL, (after_id, limit))
             rows = cur.fetchall()
 
         return [
             ChunkForEmbedding(
-                id=row["id"],
-                document_id=row["document_id"],
-                chunk_index=row["chunk_index"],
-                text=row["text"],
+                id=row[0],
+                document_id=row[1],
+                chunk_index=row[2],
+                text=row[3],
             )
             for row in rows
         ]
@@ -389,30 +929,46 @@ class DocumentRepository:
         embedding: Sequence[float],
         embedding_model: str,
         embedding_dimensions: int,
+        cur: Optional[psycopg2.extensions.cursor] = None,  # type: ignore[name-defined]
     ) -> None:
-        query = """
-            UPDATE wh.document_chunks
-            SET
-                embedding = %s,
-                embedding_model = %s,
-                embedding_dimensions = %s,
-                embedding_updated_at = NOW(),
-                updated_at = NOW()
-            WHERE id = %s;
-        """
-        embedding_literal = self._vector_literal(embedding)
-
-        with get_cursor(commit=True) as cur:
-            cur.execute(
-                query,
+        with _write_cursor(cur) as target:
+            target.execute(
+                _UPDATE_CHUNK_EMBEDDING_SQL,
                 (
-                    embedding_literal,
+                    np.asarray(embedding, dtype=np.float32),
                     embedding_model,
                     embedding_dimensions,
                     chunk_id,
                 ),
             )
 
+    def update_chunk_embeddings_bulk(
+        self,
+        updates: Sequence[tuple[int, Sequence[float], str, int]],
+        *,
+        cur: Optional[psycopg2.extensions.cursor] = None,  # type: ignore[name-defined]
+    ) -> int:
+        """Apply `(chunk_id, embedding, model, dimensions)` updates in one statement."""
+
+        if not updates:
+            return 0
+
+        values = [
+            (chunk_id, np.asarray(embedding, dtype=np.float32), model, dimensions)
+            for chunk_id, embedding, model, dimensions in updates
+        ]
+
+        with _write_cursor(cur) as target:
+            execute_values(
+                target,
+                _UPDATE_CHUNK_EMBEDDINGS_BULK_SQL,
+                values,
+                template="(%s, %s::vector, %s, %s)",
+                page_size=500,
+            )
+
+        return len(values)
+
     def search_chunks_by_embedding(
         self,
         *,
@@ -423,7 +979,7 @@ class DocumentRepository:
         if limit <= 0:
             return []
 
-        embedding_literal = self._vector_literal(embedding)
+        embedding_param = np.asarray(embedding, dtype=np.float32)
         query_parts = [
             """
             SELECT
@@ -431,7 +987,7 @@ class DocumentRepository:
                 c.document_id,
                 c.chunk_index,
                 c.text,
-                (c.embedding <=> %s) AS distance,
+                1 - (c.embedding <=> %s) AS similarity,
                 d.title,
                 d.url,
                 d.date_published,
@@ -441,15 +997,18 @@ class DocumentRepository:
             WHERE c.embedding IS NOT NULL
             """
         ]
-        params: list[object] = [embedding_literal]
+        params: list[object] = [embedding_param]
 
         if admins:
             placeholders = ", ".join(["%s"] * len(admins))
             query_parts.append(f"AND d.admin IN ({placeholders})")
             params.extend(admins)
 
-        query_parts.append("ORDER BY c.embedding <=> %s")
-        params.append(embedding_literal)
+        # Order by the halfvec (fp16) cast so the ANN scan runs against the
+        # half-width expression index; the similarity reported above stays
+        # full fp32, which exactly re-scores the returned rows.
+        query_parts.append("ORDER BY c.embedding::halfvec(1536) <=> %s::halfvec(1536)")
+        params.append(embedding_param)
         query_parts.append("LIMIT %s")
         params.append(limit)
         query = "\n".join(query_parts)
@@ -463,18 +1022,23 @@ class DocumentRepository:
                 chunk_id=row["chunk_id"],
                 document_id=row["document_id"],
                 chunk_index=row["chunk_index"],
-                score=row["distance"],
+                score=row["similarity"],
                 text=row["text"],
                 title=row["title"],
                 url=row["url"],
                 date_published=row["date_published"],
+                date_published_iso=(
+                    row["date_published"].isoformat()
+                    if row["date_published"]
+                    else None
+                ),
                 admin=row["admin"],
             )
             for row in rows
         ]
 
 
-@dataclass
+@dataclass(slots=True)
 class DocumentForChunking:
     """Minimal payload used when generating document chunks."""
 
@@ -483,7 +1047,7 @@ class DocumentForChunking:
     clean_text: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ChunkForEmbedding:
     """Represents a chunk row awaiting an embedding."""
 
@@ -493,9 +1057,13 @@ class ChunkForEmbedding:
     text: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SearchResult:
-    """Represents the outcome of a semantic search query."""
+    """Represents the outcome of a semantic search query.
+
+    `score` is the cosine similarity computed in SQL (1 = identical),
+    so consumers never need to convert from `<=>` distance themselves.
+    """
 
     chunk_id: int
     document_id: int
@@ -505,4 +1073,7 @@ class SearchResult:
     title: Optional[str]
     url: str
     date_published: Optional[date]
+    # Rendered once at construction; the formatters reuse it instead of
+    # calling isoformat() per line of output.
+    date_published_iso: Optional[str]
     admin: str
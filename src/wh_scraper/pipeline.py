@@ -0,0 +1,159 @@
+"""Fused chunk+embed pipeline CLI.
+
+Runs the chunking and embedding stages of `chunk.py` and `embed.py` as one
+process, with bounded queues between stages so embedding requests start
+while later documents are still being streamed and tokenized, and each
+chunk row is written together with its embedding in a single insert.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+from typing import Iterable, Iterator, Optional
+
+from .config import SETTINGS
+from .models import DocumentForChunking, DocumentRepository
+from .vectorization import OpenAIEmbeddingClient, TextChunker
+
+
+LOGGER = logging.getLogger(__name__)
+
+QUEUE_SIZE = 32
+WRITE_BUFFER_ROWS = 256
+
+# (document_id, chunk_index, text, embedding, model, dimensions)
+_ChunkRow = tuple[int, int, str, "list[float]", str, int]
+
+
+async def run_pipeline(*, limit: int) -> int:
+    repo = DocumentRepository()
+    chunker = TextChunker(
+        max_tokens=SETTINGS.chunk_max_tokens,
+        overlap_tokens=SETTINGS.chunk_overlap_tokens,
+    )
+    client = OpenAIEmbeddingClient()
+    loop = asyncio.get_running_loop()
+
+    doc_queue: asyncio.Queue[Optional[DocumentForChunking]] = asyncio.Queue(QUEUE_SIZE)
+    chunk_queue: asyncio.Queue[Optional[tuple[int, list[tuple[str, int]]]]] = asyncio.Queue(QUEUE_SIZE)
+    write_queue: asyncio.Queue[Optional[list[_ChunkRow]]] = asyncio.Queue(QUEUE_SIZE)
+
+    def _next_document(
+        documents: Iterator[DocumentForChunking],
+    ) -> Optional[DocumentForChunking]:
+        return next(documents, None)
+
+    async def produce_documents() -> None:
+        documents = repo.list_documents_without_chunks(limit)
+        while True:
+            document = await loop.run_in_executor(None, _next_document, documents)
+            if document is None:
+                break
+            await doc_queue.put(document)
+        await doc_queue.put(None)
+
+    async def chunk_worker() -> None:
+        while True:
+            document = await doc_queue.get()
+            if document is None:
+                break
+
+            chunk_pairs = await loop.run_in_executor(
+                None, chunker.chunk_text_with_counts, document.clean_text
+            )
+            if not chunk_pairs:
+                LOGGER.warning(
+                    "Document %s has no chunkable text, skipping", document.id
+                )
+                continue
+            await chunk_queue.put((document.id, chunk_pairs))
+        await chunk_queue.put(None)
+
+    async def embed_worker() -> None:
+        while True:
+            item = await chunk_queue.get()
+            if item is None:
+                break
+
+            document_id, chunk_pairs = item
+            chunks = [text for text, _ in chunk_pairs]
+            # The chunker already knows each window's token count; hand
+            # it over so request packing skips a second BPE pass.
+            batch = await client.embed_in_batches_async(
+                chunks, token_counts=[count for _, count in chunk_pairs]
+            )
+            rows: list[_ChunkRow] = [
+                (document_id, index, text, vector, batch.model, batch.dimensions)
+                for index, (text, vector) in enumerate(zip(chunks, batch.vectors))
+            ]
+            await write_queue.put(rows)
+            LOGGER.info(
+                "Embedded document %s (%d chunks)", document_id, len(rows)
+            )
+        await write_queue.put(None)
+
+    async def db_writer() -> int:
+        buffer: list[_ChunkRow] = []
+        written = 0
+        while True:
+            rows = await write_queue.get()
+            if rows is None:
+                break
+
+            buffer.extend(rows)
+            if len(buffer) >= WRITE_BUFFER_ROWS:
+                flush = list(buffer)
+                buffer.clear()
+                written += await loop.run_in_executor(
+                    None, repo.insert_document_chunks_with_embeddings, flush
+                )
+
+        if buffer:
+            written += await loop.run_in_executor(
+                None, repo.insert_document_chunks_with_embeddings, buffer
+            )
+        return written
+
+    _, _, _, written = await asyncio.gather(
+        produce_documents(), chunk_worker(), embed_worker(), db_writer()
+    )
+
+    if not written:
+        LOGGER.info("No documents are pending chunking")
+    else:
+        LOGGER.info("Pipeline complete: %d chunk rows written", written)
+    return written
+
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Chunk and embed scraped documents in one fused pipeline"
+    )
+    parser.add_argument(
+        "--limit",
+        type=int,
+        default=25,
+        help="Maximum number of documents to process in this run",
+    )
+    return parser
+
+
+def main(argv: Iterable[str] | None = None) -> None:
+    parser = build_arg_parser()
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s %(levelname)s [%(name)s] %(message)s",
+    )
+
+    if args.limit < 1:
+        parser.error("--limit must be >= 1")
+
+    asyncio.run(run_pipeline(limit=args.limit))
+
+
+if __name__ == "__main__":
+    main()
@@ -4,91 +4,110 @@ from __future__ import annotations
 
 import argparse
 import logging
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from typing import Iterable, Optional
 
 import requests
-from bs4 import BeautifulSoup
+from lxml import html as lxml_html
+from lxml.etree import XPath
+from lxml.html import HtmlElement
+from requests.adapters import HTTPAdapter
 
-from .models import DocumentRepository
-from .utils import extract_clean_text, fetch_html, parse_date, parse_datetime
+from .models import DocumentPending, DocumentRepository
+from .utils import fetch_html_conditional, parse_date, parse_datetime
 
 
 LOGGER = logging.getLogger(__name__)
 
-
-def _class_contains(value: object, needle: str) -> bool:
-    if isinstance(value, str):
-        return needle in value.lower()
-    if isinstance(value, (list, tuple, set)):
-        return any(isinstance(part, str) and needle in part.lower() for part in value)
-    return False
-
-
-def _select_main_content(soup: BeautifulSoup) -> BeautifulSoup:
-    selectors = [
-        "article .entry-content",
-        "article .page-content",
-        "article .content",
-        ".entry-content",
-        ".page-content",
-        ".content",
-    ]
-
-    for selector in selectors:
-        node = soup.select_one(selector)
-        if node:
-            return node
-
-    article = soup.find("article")
-    if article:
-        return article
-    if soup.body:
-        return soup.body
-    return soup
-
-
-def _extract_location(soup: BeautifulSoup) -> Optional[str]:
-    candidate = soup.find(class_=lambda c: _class_contains(c, "location"))
-    if candidate:
-        text = candidate.get_text(" ", strip=True)
+FLUSH_EVERY = 100
+
+# Selectors are compiled once; the XPath machinery walks the tree in C
+# rather than calling back into Python per node.
+_MAIN_CONTENT_XPATHS = tuple(
+    XPath(expr)
+    for expr in (
+        "(//article//*[contains(@class, 'entry-content')])[1]",
+        "(//article//*[contains(@class, 'page-content')])[1]",
+        "(//article//*[contains(@class, 'content')])[1]",
+        "(//*[contains(@class, 'entry-content')])[1]",
+        "(//*[contains(@class, 'page-content')])[1]",
+        "(//*[contains(@class, 'content')])[1]",
+        "(//article)[1]",
+        "(//body)[1]",
+    )
+)
+_H1_XPATH = XPath("(//h1)[1]")
+_TIME_XPATH = XPath("(//time)[1]")
+_LOCATION_XPATH = XPath(
+    '(//*[contains(translate(@class, "ABCDEFGHIJKLMNOPQRSTUVWXYZ",'
+    ' "abcdefghijklmnopqrstuvwxyz"), "location")])[1]'
+)
+_DATE_FALLBACK_XPATH = XPath(
+    '(//*[contains(translate(@class, "ABCDEFGHIJKLMNOPQRSTUVWXYZ",'
+    ' "abcdefghijklmnopqrstuvwxyz"), "date")])[1]'
+)
+_STRONG_XPATH = XPath("//strong")
+_BLOCK_XPATH = XPath(".//p | .//blockquote | .//li | .//h2 | .//h3")
+
+
+def _element_text(node: HtmlElement) -> str:
+    return " ".join(node.text_content().split())
+
+
+def _select_main_content(root: HtmlElement) -> HtmlElement:
+    for xpath in _MAIN_CONTENT_XPATHS:
+        nodes = xpath(root)
+        if nodes:
+            return nodes[0]
+    return root
+
+
+def _extract_location(root: HtmlElement) -> Optional[str]:
+    candidates = _LOCATION_XPATH(root)
+    if candidates:
+        text = _element_text(candidates[0])
         if text:
             return text
 
-    strong_labels = soup.find_all("strong")
-    for strong in strong_labels:
-        label = strong.get_text(strip=True)
+    for strong in _STRONG_XPATH(root):
+        label = _element_text(strong)
         if label and label.lower().startswith("location"):
-            parent_text = strong.parent.get_text(" ", strip=True)
-            return parent_text
+            parent = strong.getparent()
+            if parent is not None:
+                return _element_text(parent)
 
     return None
 
 
-def parse_detail_page(html: str) -> dict:
-    soup = BeautifulSoup(html, "lxml")
-    main_content = _select_main_content(soup)
+def parse_detail_page(html: str | bytes) -> dict:
+    # lxml accepts the raw response bytes and sniffs the declared
+    # encoding itself, so no Python-level decode of the page is needed.
+    root = lxml_html.fromstring(html)
+    main_content = _select_main_content(root)
 
-    title_el = soup.find("h1") or main_content.find("h1")
-    title = title_el.get_text(strip=True) if title_el else None
+    title_els = _H1_XPATH(root)
+    title = _element_text(title_els[0]) if title_els else None
 
-    time_el = soup.find("time") or main_content.find("time")
+    time_els = _TIME_XPATH(root)
     datetime_value = None
     date_value = None
-    if time_el:
-        date_source = time_el.get("datetime") or time_el.get_text(strip=True)
+    if time_els:
+        time_el = time_els[0]
+        date_source = time_el.get("datetime") or _element_text(time_el)
         datetime_value = parse_datetime(date_source)
         date_value = datetime_value.date() if datetime_value else parse_date(date_source)
     else:
-        date_block = soup.find(class_=lambda c: _class_contains(c, "date"))
-        if date_block:
-            date_value = parse_date(date_block.get_text(strip=True))
+        date_blocks = _DATE_FALLBACK_XPATH(root)
+        if date_blocks:
+            date_value = parse_date(_element_text(date_blocks[0]))
 
-    clean_text = extract_clean_text(main_content)
+    pieces = [_element_text(block) for block in _BLOCK_XPATH(main_content)]
+    clean_text = "\n\n".join(piece for piece in pieces if piece).strip()
     if not clean_text:
-        clean_text = soup.get_text(" ", strip=True)
+        clean_text = _element_text(root)
 
-    raw_html = str(main_content)
-    location = _extract_location(soup)
+    raw_html = lxml_html.tostring(main_content, encoding="unicode")
+    location = _extract_location(root)
 
     return {
         "title": title,
@@ -100,31 +119,103 @@ def parse_detail_page(html: str) -> dict:
     }
 
 
-def scrape(*, limit: int) -> None:
-    repo = DocumentRepository()
-    pending = repo.list_pending(limit)
-    if not pending:
-        LOGGER.info("No pending documents found")
-        return
+def _fetch_document(
+    document: DocumentPending, session: requests.Session
+) -> tuple[Optional[bytes], Optional[str], Optional[str]]:
+    return fetch_html_conditional(
+        document.url,
+        session=session,
+        etag=document.etag,
+        last_modified=document.last_modified,
+    )
+
 
+def scrape(
+    *,
+    limit: int,
+    workers: int = 16,
+    parse_workers: Optional[int] = None,
+) -> None:
+    repo = DocumentRepository()
     session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=workers, pool_maxsize=workers)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
     successes = 0
-
-    for document in pending:
-        LOGGER.info("Scraping %s", document.url)
-        try:
-            html = fetch_html(document.url, session=session)
-            parsed = parse_detail_page(html)
-            repo.mark_scraped(document_id=document.id, **parsed)
-            successes += 1
-        except requests.RequestException as exc:
-            LOGGER.error("Network error for %s: %s", document.url, exc)
-            repo.mark_error(document_id=document.id, error=str(exc))
-        except Exception as exc:  # pragma: no cover - defensive guard
-            LOGGER.exception("Failed parsing %s", document.url)
-            repo.mark_error(document_id=document.id, error=str(exc))
-
-    LOGGER.info("Scrape completed: %d succeeded, %d attempted", successes, len(pending))
+    attempted = 0
+    scraped_rows: list[dict] = []
+    error_rows: list[tuple[int, str]] = []
+    unchanged_ids: list[int] = []
+
+    def _flush() -> None:
+        nonlocal successes
+        if scraped_rows:
+            successes += repo.mark_scraped_bulk(scraped_rows)
+            scraped_rows.clear()
+        if unchanged_ids:
+            successes += repo.mark_unchanged_bulk(unchanged_ids)
+            unchanged_ids.clear()
+        if error_rows:
+            repo.mark_error_bulk(error_rows)
+            error_rows.clear()
+
+    # Fetching runs on the thread pool (GIL released in socket waits) while
+    # parsing runs on a process pool, so large pages scale across cores.
+    # Results are buffered on the main thread and flushed to Postgres in
+    # batched UPDATEs; iter_pending prefetches the next batch of pending
+    # rows while the current batch is in flight.
+    with ProcessPoolExecutor(max_workers=parse_workers) as cpu_pool, ThreadPoolExecutor(
+        max_workers=workers
+    ) as executor:
+        for batch in repo.iter_pending(batch_size=FLUSH_EVERY, limit=limit):
+            attempted += len(batch)
+            fetch_futures = {
+                executor.submit(_fetch_document, document, session): document
+                for document in batch
+            }
+
+            parse_futures = {}
+            for future in as_completed(fetch_futures):
+                document = fetch_futures[future]
+                try:
+                    body, etag, last_modified = future.result()
+                except requests.RequestException as exc:
+                    LOGGER.error("Network error for %s: %s", document.url, exc)
+                    error_rows.append((document.id, str(exc)))
+                else:
+                    if body is None:
+                        unchanged_ids.append(document.id)
+                        LOGGER.info("Unchanged (304) %s", document.url)
+                    else:
+                        parse_future = cpu_pool.submit(parse_detail_page, body)
+                        parse_futures[parse_future] = (document, etag, last_modified)
+
+            for future in as_completed(parse_futures):
+                document, etag, last_modified = parse_futures[future]
+                try:
+                    parsed = future.result()
+                except Exception as exc:  # pragma: no cover - defensive guard
+                    LOGGER.exception("Failed parsing %s", document.url)
+                    error_rows.append((document.id, str(exc)))
+                else:
+                    scraped_rows.append(
+                        {
+                            "document_id": document.id,
+                            "etag": etag,
+                            "last_modified": last_modified,
+                            **parsed,
+                        }
+                    )
+                    LOGGER.info("Scraped %s", document.url)
+
+                if len(scraped_rows) + len(error_rows) >= FLUSH_EVERY:
+                    _flush()
+
+    _flush()
+    if not attempted:
+        LOGGER.info("No pending documents found")
+        return
+    LOGGER.info("Scrape completed: %d succeeded, %d attempted", successes, attempted)
 
 
 def build_arg_parser() -> argparse.ArgumentParser:
@@ -135,6 +226,18 @@ def build_arg_parser() -> argparse.ArgumentParser:
         default=100,
         help="Maximum number of pending records to process",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=16,
+        help="Number of concurrent fetch workers",
+    )
+    parser.add_argument(
+        "--parse-workers",
+        type=int,
+        default=None,
+        help="Number of parser processes (default: CPU count)",
+    )
     return parser
 
 
@@ -149,8 +252,12 @@ def main(argv: Iterable[str] | None = None) -> None:
 
     if args.limit < 1:
         parser.error("--limit must be >= 1")
+    if args.workers < 1:
+        parser.error("--workers must be >= 1")
+    if args.parse_workers is not None and args.parse_workers < 1:
+        parser.error("--parse-workers must be >= 1")
 
-    scrape(limit=args.limit)
+    scrape(limit=args.limit, workers=args.workers, parse_workers=args.parse_workers)
 
 
 if __name__ == "__main__":
@@ -3,23 +3,156 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
+import functools
+import io
 import json
 import logging
+import re
+import threading
+import time
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Iterable, List, Sequence
 
-from openai import OpenAI
+import numpy as np
+import tiktoken
+from openai import AsyncOpenAI
 
 from .config import SETTINGS
 from .models import DocumentRepository, SearchResult
-from .vectorization import OpenAIEmbeddingClient
+from .vectorization import EmbeddingCache, OpenAIEmbeddingClient
 
 
 LOGGER = logging.getLogger(__name__)
 
+class QueryVectorCache:
+    """Proximity cache mapping recent query vectors to ANN result lists.
 
-@dataclass
+    Identity-keyed caches miss rephrasings that embed to nearly the same
+    point; here an incoming query is served from cache when its cosine
+    similarity to a stored query vector clears a threshold and the cached
+    entry covers the requested limit and admin filter. Entries expire
+    after a TTL so long-lived workers pick up newly embedded documents;
+    a hot query otherwise refreshes its LRU slot forever.
+    """
+
+    MAX_ENTRIES = 64
+    TTL_SECONDS = 300.0
+
+    def __init__(self, *, threshold: float | None = None) -> None:
+        self.threshold = threshold or SETTINGS.query_cache_threshold
+        self._lock = threading.Lock()
+        self._entries: list[
+            tuple[object, int, tuple[str, ...] | None, list[SearchResult], float]
+        ] = []
+
+    @staticmethod
+    def _normalize(vector: Sequence[float]):
+        arr = np.asarray(vector, dtype=np.float32)
+        norm = float(np.linalg.norm(arr))
+        if norm == 0.0:
+            return arr
+        return arr / norm
+
+    def get(
+        self,
+        vector: Sequence[float],
+        *,
+        limit: int,
+        admins: tuple[str, ...] | None,
+    ) -> list[SearchResult] | None:
+        query = self._normalize(vector)
+        now = time.monotonic()
+        with self._lock:
+            self._entries = [
+                entry
+                for entry in self._entries
+                if now - entry[4] < self.TTL_SECONDS
+            ]
+            candidates = [
+                (index, entry)
+                for index, entry in enumerate(self._entries)
+                if entry[1] >= limit and entry[2] == admins
+            ]
+            if not candidates:
+                return None
+
+            key_matrix = np.vstack([entry[0] for _, entry in candidates])
+            similarities = key_matrix @ query
+            best = int(np.argmax(similarities))
+            if float(similarities[best]) < self.threshold:
+                return None
+
+            index, entry = candidates[best]
+            # LRU: refresh the winning entry's position.
+            self._entries.append(self._entries.pop(index))
+            return entry[3][:limit]
+
+    def put(
+        self,
+        vector: Sequence[float],
+        *,
+        limit: int,
+        admins: tuple[str, ...] | None,
+        results: list[SearchResult],
+    ) -> None:
+        key = self._normalize(vector)
+        with self._lock:
+            self._entries.append(
+                (key, limit, admins, list(results), time.monotonic())
+            )
+            if len(self._entries) > self.MAX_ENTRIES:
+                self._entries.pop(0)
+
+
+_QUERY_VECTOR_CACHE: QueryVectorCache | None = None
+
+_EMBEDDING_CACHE: EmbeddingCache | None = None
+
+
+def _get_query_vector_cache() -> QueryVectorCache:
+    global _QUERY_VECTOR_CACHE
+    if _QUERY_VECTOR_CACHE is None:
+        _QUERY_VECTOR_CACHE = QueryVectorCache()
+    return _QUERY_VECTOR_CACHE
+
+
+def _get_embedding_cache() -> EmbeddingCache:
+    global _EMBEDDING_CACHE
+    if _EMBEDDING_CACHE is None:
+        _EMBEDDING_CACHE = EmbeddingCache()
+    return _EMBEDDING_CACHE
+
+
+def _normalize_query_key(cleaned: str) -> str:
+    """Collapse whitespace and case for the embedding-cache key.
+
+    "Press Briefing" and "press  briefing" embed to effectively the same
+    vector, so they should share one cache entry and one API call.
+    """
+
+    return " ".join(cleaned.split()).casefold()
+
+
+def _embed_query(client: OpenAIEmbeddingClient, cleaned: str) -> list[float] | None:
+    """Embed one query, short-circuiting through the persistent cache."""
+
+    cache = _get_embedding_cache()
+    cache_key = _normalize_query_key(cleaned)
+    vector = cache.get(client.model, cache_key)
+    if vector is not None:
+        return vector
+
+    batch = client.embed_texts([cleaned])
+    if batch.vectors.size == 0:
+        return None
+    vector = list(batch.vectors[0])
+    cache.put(client.model, cache_key, vector)
+    return vector
+
+
+@dataclass(slots=True, frozen=True)
 class LLMJudgment:
     """Outcome returned by the relevance model."""
 
@@ -28,7 +161,7 @@ class LLMJudgment:
     explanation: str | None = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AdvancedSearchResult:
     """Enriches ANN results with judgments from the relevance model."""
 
@@ -36,7 +169,7 @@ class AdvancedSearchResult:
     judgment: LLMJudgment
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SearchOutput:
     """Represents a row returned to the CLI or file writer."""
 
@@ -49,27 +182,29 @@ def format_result(output: SearchOutput, index: int) -> str:
     judgment = output.judgment
     header = f"{index}. {result.title or 'Untitled'}"
     meta = []
-    if result.date_published:
-        meta.append(result.date_published.isoformat())
+    if result.date_published_iso:
+        meta.append(result.date_published_iso)
     meta.append(result.admin)
     meta_text = ", ".join(meta)
-    snippet = result.text.strip().replace("\n", " ")
+    # Work on a bounded prefix so multi-KB chunks aren't copied wholesale
+    # just to render a 280-char snippet.
+    snippet = result.text[:600].strip().replace("\n", " ")
     if len(snippet) > 280:
         snippet = snippet[:277].rstrip() + "..."
-    lines = [
-        f"{header} ({meta_text})",
-        f"   score={result.score:.4f} chunk={result.chunk_index} url={result.url}",
-        f"   {snippet}",
-    ]
+    buf = io.StringIO()
+    buf.write(f"{header} ({meta_text})\n")
+    buf.write(
+        f"   score={result.score:.4f} chunk={result.chunk_index} url={result.url}\n"
+    )
+    buf.write(f"   {snippet}")
     if judgment:
         if judgment.valid_response:
-            judgment_line = f"   LLM relevance: {judgment.response}"
+            buf.write(f"\n   LLM relevance: {judgment.response}")
         else:
-            judgment_line = f"   LLM response invalid: {judgment.response or 'empty'}"
+            buf.write(f"\n   LLM response invalid: {judgment.response or 'empty'}")
         if judgment.explanation:
-            judgment_line += f" ({judgment.explanation})"
-        lines.append(judgment_line)
-    return "\n".join(lines)
+            buf.write(f" ({judgment.explanation})")
+    return buf.getvalue()
 
 
 def search(
@@ -83,16 +218,102 @@ def search(
         raise ValueError("Query cannot be empty")
 
     client = OpenAIEmbeddingClient()
-    batch = client.embed_texts([cleaned])
-    if not batch.vectors:
+    vector = _embed_query(client, cleaned)
+    if vector is None:
         return []
 
+    admins = tuple(admin_filter) if admin_filter else None
+    return _search_by_vector(vector, limit=limit, admins=admins)
+
+
+# How many extra ANN candidates to pull per requested hit. The fp16
+# index orders approximately; the oversampled pool is re-cut by the
+# exact fp32 similarity before returning.
+_RERANK_OVERSAMPLE = 4
+
+
+def _rerank_top_k(results: list[SearchResult], limit: int) -> list[SearchResult]:
+    """Keep the `limit` best results by exact similarity, best first.
+
+    argpartition selects the winners in O(n) before the final O(k log k)
+    sort, so the oversampled pool never pays for a full ordering.
+    """
+
+    scores = np.fromiter(
+        (result.score for result in results), dtype=np.float32, count=len(results)
+    )
+    if len(results) > limit:
+        top = np.argpartition(-scores, limit - 1)[:limit]
+    else:
+        top = np.arange(len(results))
+    ordered = top[np.argsort(-scores[top], kind="stable")]
+    return [results[index] for index in ordered]
+
+
+def _search_by_vector(
+    vector: Sequence[float],
+    *,
+    limit: int,
+    admins: tuple[str, ...] | None,
+) -> list[SearchResult]:
+    vector_cache = _get_query_vector_cache()
+    cached = vector_cache.get(vector, limit=limit, admins=admins)
+    if cached is not None:
+        return cached
+
     repo = DocumentRepository()
-    return repo.search_chunks_by_embedding(
-        embedding=batch.vectors[0],
-        limit=limit,
-        admins=tuple(admin_filter) if admin_filter else None,
+    candidates = repo.search_chunks_by_embedding(
+        embedding=vector,
+        limit=limit * _RERANK_OVERSAMPLE,
+        admins=admins,
     )
+    results = _rerank_top_k(candidates, limit) if candidates else candidates
+    vector_cache.put(vector, limit=limit, admins=admins, results=results)
+    return results
+
+
+def search_many(
+    queries: Sequence[str],
+    *,
+    limit: int,
+    admin_filter: Sequence[str] | None = None,
+) -> list[list[SearchResult]]:
+    """Run several queries, embedding all cache misses in one API request.
+
+    Returns one result list per input query, in input order.
+    """
+
+    cleaned_queries = [query.strip() for query in queries]
+    if not all(cleaned_queries):
+        raise ValueError("Queries cannot be empty")
+
+    client = OpenAIEmbeddingClient()
+    cache = _get_embedding_cache()
+
+    # Dedupe while preserving order, then embed only the cache misses in a
+    # single batched request.
+    unique_queries = list(dict.fromkeys(cleaned_queries))
+    vectors: dict[str, list[float]] = {}
+    missing: list[str] = []
+    for query in unique_queries:
+        vector = cache.get(client.model, _normalize_query_key(query))
+        if vector is not None:
+            vectors[query] = vector
+        else:
+            missing.append(query)
+
+    if missing:
+        batch = client.embed_texts(missing)
+        for query, vector in zip(missing, batch.vectors):
+            vector = list(vector)
+            cache.put(client.model, _normalize_query_key(query), vector)
+            vectors[query] = vector
+
+    admins = tuple(admin_filter) if admin_filter else None
+    return [
+        _search_by_vector(vectors[query], limit=limit, admins=admins)
+        for query in cleaned_queries
+    ]
 
 
 def advanced_search(
@@ -114,7 +335,12 @@ def advanced_search(
 
 def build_arg_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Semantic search over WH transcripts")
-    parser.add_argument("query", help="Free text to search for")
+    parser.add_argument("query", nargs="?", help="Free text to search for")
+    parser.add_argument(
+        "--queries-file",
+        metavar="PATH",
+        help="File with one query per line; all queries share one embedding request",
+    )
     parser.add_argument(
         "--limit",
         type=int,
@@ -185,25 +411,32 @@ def write_results_to_file(
         separator_parts.append(separating_char * 80)
         separator_parts.append("\n")
     separator = "".join(separator_parts)
-    # Convert distances (0 = identical) to cosine similarities (1 = identical) for reporting.
-    cosine_scores = [1 - output.chunk.score for output in results]
-    max_similarity = max(cosine_scores, default=0.0)
-    min_similarity = min(cosine_scores, default=0.0)
-    unique_documents = len({output.chunk.document_id for output in results})
-    has_judgments = any(output.judgment for output in results)
-    valid_judgments = [
-        output for output in results if output.judgment and output.judgment.valid_response
-    ]
-    accepted = [
-        output
-        for output in valid_judgments
-        if output.judgment and output.judgment.response == "YES"
-    ]
-    rejected = [
-        output
-        for output in valid_judgments
-        if output.judgment and output.judgment.response == "NO"
-    ]
+    # Score and document-id aggregates run as NumPy reductions over
+    # parallel arrays; only the judgment tallies need a Python pass.
+    count = len(results)
+    scores = np.fromiter(
+        (output.chunk.score for output in results), dtype=np.float32, count=count
+    )
+    doc_ids = np.fromiter(
+        (output.chunk.document_id for output in results), dtype=np.int64, count=count
+    )
+    max_similarity = float(scores.max()) if count else 0.0
+    min_similarity = float(scores.min()) if count else 0.0
+    unique_documents = int(np.unique(doc_ids).size)
+
+    has_judgments = False
+    valid_count = accepted_count = rejected_count = 0
+    for output in results:
+        judgment = output.judgment
+        if judgment:
+            has_judgments = True
+            if judgment.valid_response:
+                valid_count += 1
+                if judgment.response == "YES":
+                    accepted_count += 1
+                elif judgment.response == "NO":
+                    rejected_count += 1
+
     metadata_lines = [
         f"Query: {query}",
         f"Limit: {limit}",
@@ -214,60 +447,98 @@ def write_results_to_file(
     if has_judgments:
         metadata_lines.extend(
             [
-                f"LLM valid responses: {len(valid_judgments)}/{len(results)}",
-                f"LLM accepted (YES): {len(accepted)}",
-                f"LLM rejected (NO): {len(rejected)}",
+                f"LLM valid responses: {valid_count}/{len(results)}",
+                f"LLM accepted (YES): {accepted_count}",
+                f"LLM rejected (NO): {rejected_count}",
             ]
         )
     metadata = "\n".join(metadata_lines).rstrip("\n") + "\n\n"
 
-    chunk_sections = []
-    for output in results:
-        chunk = output.chunk
-        date_value = chunk.date_published.isoformat() if chunk.date_published else "Unknown"
-        section_lines = [
-            f"Title: {chunk.title or 'Untitled'}",
-            f"Date published: {date_value}",
-            f"Document ID: {chunk.document_id}",
-            f"Document URL: {chunk.url}",
-            f"Chunk index: {chunk.chunk_index}",
-            f"Cosine distance: {chunk.score:.6f}",
-        ]
-        if output.judgment:
-            section_lines.append(f"LLM valid response: {output.judgment.valid_response}")
-            section_lines.append(f"LLM relevance: {output.judgment.response or 'N/A'}")
-            if output.judgment.explanation:
-                section_lines.append(f"LLM explanation: {output.judgment.explanation}")
-        section_lines.extend(["", chunk.text.strip()])
-        chunk_sections.append("\n".join(section_lines).rstrip())
-
-    chunk_text = separator.join(chunk_sections)
-    if chunk_text and not chunk_text.endswith("\n"):
-        chunk_text += "\n"
-
-    output_path.write_text(metadata + chunk_text, encoding="utf-8")
+    # Stream sections straight to the file: peak memory stays at one
+    # chunk's text instead of every section concatenated twice.
+    with output_path.open("w", encoding="utf-8", buffering=1 << 20) as fh:
+        fh.write(metadata)
+        for index, output in enumerate(results):
+            if index:
+                fh.write(separator)
+            chunk = output.chunk
+            date_value = chunk.date_published_iso or "Unknown"
+            fh.write(f"Title: {chunk.title or 'Untitled'}\n")
+            fh.write(f"Date published: {date_value}\n")
+            fh.write(f"Document ID: {chunk.document_id}\n")
+            fh.write(f"Document URL: {chunk.url}\n")
+            fh.write(f"Chunk index: {chunk.chunk_index}\n")
+            fh.write(f"Cosine similarity: {chunk.score:.6f}")
+            if output.judgment:
+                fh.write(f"\nLLM valid response: {output.judgment.valid_response}")
+                fh.write(f"\nLLM relevance: {output.judgment.response or 'N/A'}")
+                if output.judgment.explanation:
+                    fh.write(f"\nLLM explanation: {output.judgment.explanation}")
+            fh.write("\n\n")
+            fh.write(chunk.text.strip())
+        if results:
+            fh.write("\n")
+
     return output_path
 
 
+_WORD_RE = re.compile(r"\S+")
+_FENCE_RE = re.compile(r"^\s*```[^\n]*\n(.*?)\n?```\s*$", re.S)
+
+
 def trim_text(text: str, max_words: int) -> str:
-    words = text.split()
-    if len(words) <= max_words:
-        return text.strip()
-    trimmed = " ".join(words[:max_words]).strip()
-    if not trimmed:
-        return text.strip()
-    return f"{trimmed}..."
+    """Truncate to `max_words` words without materializing a word list.
+
+    Scans at most `max_words + 1` whitespace runs and slices the original
+    string once, so cost is O(max_words) rather than O(len(text)).
+    """
+
+    last_end = 0
+    for count, match in enumerate(_WORD_RE.finditer(text), start=1):
+        if count > max_words:
+            trimmed = text[:last_end].strip()
+            if not trimmed:
+                return text.strip()
+            return f"{trimmed}..."
+        last_end = match.end()
+    return text.strip()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_encoding() -> tiktoken.Encoding:
+    return tiktoken.get_encoding("cl100k_base")
+
+
+# Static instructions live in the system message and stay byte-identical
+# across every batch in a session, so provider-side prompt-prefix caches
+# only ever re-process the query and chunks.
+_JUDGE_SYSTEM_PROMPT = (
+    "You judge relevance and only reply with JSON that matches the request. "
+    "You are a precise relevance judge. "
+    "For each chunk determine if it directly helps answer the query.\n"
+    "Respond with a JSON array in the same order as the chunks. "
+    "Each array entry must be an object with:\n"
+    '{"answer":"YES" or "NO","explanation":"short reason"}\n'
+    "Only answer YES when the chunk is clearly helpful. "
+    "If the chunk is clearly helpful, additionally state what part of the query it relates to. "
+    "Keep in mind that if the query is nonsense, then nothing should be helpful to answering the query. "
+)
 
 
 class LLMRelevanceJudge:
     """Batches ANN hits through a chat model to confirm relevance."""
 
+    # Rough per-chunk prompt framing cost (header line, JSON answer slot).
+    CHUNK_TOKEN_OVERHEAD = 32
+
     def __init__(
         self,
         *,
         api_key: str | None = None,
         model: str | None = None,
         batch_size: int | None = None,
+        concurrency: int | None = None,
+        token_budget: int | None = None,
         max_words: int | None = None,
     ) -> None:
         key = api_key or SETTINGS.openai_api_key
@@ -276,63 +547,129 @@ class LLMRelevanceJudge:
 
         self.model = model or SETTINGS.openai_relevance_model
         self.batch_size = batch_size or SETTINGS.relevance_batch_size
+        self.concurrency = concurrency or SETTINGS.relevance_concurrency
+        self.token_budget = token_budget or SETTINGS.relevance_token_budget
         self.max_words = max_words or SETTINGS.relevance_max_words
-        self.client = OpenAI(api_key=key)
+        self._api_key = key
+        self._async_client: AsyncOpenAI | None = None
+        self._async_client_loop: asyncio.AbstractEventLoop | None = None
 
     def judge(self, query: str, results: Sequence[SearchResult]) -> list[AdvancedSearchResult]:
         enriched: list[AdvancedSearchResult] = []
         if not results:
             return enriched
 
-        trimmed_chunks: list[tuple[SearchResult, str]] = [
-            (result, trim_text(result.text, self.max_words)) for result in results
-        ]
-        for start in range(0, len(trimmed_chunks), self.batch_size):
-            batch = trimmed_chunks[start : start + self.batch_size]
-            prompt = self._build_prompt(query, batch)
-            response_text = self._invoke(prompt)
+        trimmed_texts = [trim_text(result.text, self.max_words) for result in results]
+
+        # The same passage can surface several times (overlapping chunks,
+        # reposted briefings), and identical text always earns the same
+        # verdict — judge each distinct trimmed text once and broadcast.
+        unique: dict[str, tuple[SearchResult, str]] = {}
+        for result, trimmed_text in zip(results, trimmed_texts):
+            if trimmed_text not in unique:
+                unique[trimmed_text] = (result, trimmed_text)
+
+        batches = self._pack_batches(list(unique.values()))
+        prompts = [self._build_prompt(query, batch) for batch in batches]
+        responses = asyncio.run(self._invoke_all(prompts))
+
+        judgment_by_text: dict[str, LLMJudgment] = {}
+        for batch, response_text in zip(batches, responses):
             judgments = self._parse_response(response_text, expected=len(batch))
-            for (result, _), judgment in zip(batch, judgments):
-                enriched.append(AdvancedSearchResult(chunk=result, judgment=judgment))
+            for (_, trimmed_text), judgment in zip(batch, judgments):
+                judgment_by_text[trimmed_text] = judgment
+
+        for result, trimmed_text in zip(results, trimmed_texts):
+            enriched.append(
+                AdvancedSearchResult(
+                    chunk=result, judgment=judgment_by_text[trimmed_text]
+                )
+            )
 
         return enriched
 
+    def _pack_batches(
+        self, trimmed_chunks: Sequence[tuple[SearchResult, str]]
+    ) -> list[list[tuple[SearchResult, str]]]:
+        """Greedily pack chunks into batches by token count.
+
+        Each batch fills up to `token_budget` prompt tokens (with a small
+        per-chunk framing overhead), so many short chunks share one request
+        while a single long chunk no longer drags whole batches toward the
+        context limit. `batch_size` remains a hard cap per batch.
+        """
+
+        encoding = _get_encoding()
+        batches: list[list[tuple[SearchResult, str]]] = []
+        current: list[tuple[SearchResult, str]] = []
+        running_tokens = 0
+
+        for result, trimmed_text in trimmed_chunks:
+            tokens = len(encoding.encode(trimmed_text)) + self.CHUNK_TOKEN_OVERHEAD
+            if current and (
+                running_tokens + tokens > self.token_budget
+                or len(current) >= self.batch_size
+            ):
+                batches.append(current)
+                current = []
+                running_tokens = 0
+            current.append((result, trimmed_text))
+            running_tokens += tokens
+
+        if current:
+            batches.append(current)
+        return batches
+
     def _build_prompt(self, query: str, batch: Sequence[tuple[SearchResult, str]]) -> str:
-        sections = []
+        buf = io.StringIO()
+        buf.write(f"Query:\n{query.strip()}\n\nChunks:\n")
         for offset, (result, trimmed_text) in enumerate(batch, start=1):
-            published = result.date_published.isoformat() if result.date_published else "Unknown"
-            sections.append(
+            published = result.date_published_iso or "Unknown"
+            if offset > 1:
+                buf.write("\n\n")
+            buf.write(
                 f"Chunk {offset} (title: {result.title or 'Untitled'}, date: {published}):\n{trimmed_text}"
             )
+        return buf.getvalue()
 
-        instructions = (
-            "You are a precise relevance judge. "
-            "For each chunk determine if it directly helps answer the query.\n"
-            "Respond with a JSON array in the same order as the chunks. "
-            "Each array entry must be an object with:\n"
-            '{"answer":"YES" or "NO","explanation":"short reason"}\n'
-            "Only answer YES when the chunk is clearly helpful. "
-            "If the chunk is clearly helpful, additionally state what part of the query it relates to. "
-            "Keep in mind that if the query is nonsense, then nothing should be helpful to answering the query. "
-        )
-        sections_text = "\n\n".join(sections)
-        return f"{instructions}\n\nQuery:\n{query.strip()}\n\nChunks:\n{sections_text}"
+    def _get_async_client(self) -> AsyncOpenAI:
+        """Return an AsyncOpenAI client bound to the running event loop.
+
+        Each judge() call spins up its own loop via asyncio.run() and then
+        closes it, which orphans the client's connection pool; reusing the
+        old client on the next call would fail with "Event loop is closed".
+        Batches within one call still share the client.
+        """
 
-    def _invoke(self, prompt: str) -> str:
-        response = self.client.chat.completions.create(
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_client_loop is not loop:
+            self._async_client = AsyncOpenAI(api_key=self._api_key)
+            self._async_client_loop = loop
+        return self._async_client
+
+    async def _invoke(self, prompt: str) -> str:
+        response = await self._get_async_client().chat.completions.create(
             model=self.model,
             temperature=0,
             messages=[
-                {
-                    "role": "system",
-                    "content": "You judge relevance and only reply with JSON that matches the request.",
-                },
+                {"role": "system", "content": _JUDGE_SYSTEM_PROMPT},
                 {"role": "user", "content": prompt},
             ],
         )
         message = response.choices[0].message.content
         return message.strip() if message else ""
 
+    async def _invoke_all(self, prompts: Sequence[str]) -> list[str]:
+        """Run all batch prompts concurrently; responses keep prompt order."""
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def invoke_one(prompt: str) -> str:
+            async with semaphore:
+                return await self._invoke(prompt)
+
+        return list(await asyncio.gather(*(invoke_one(prompt) for prompt in prompts)))
+
     def _parse_response(self, payload_text: str, *, expected: int) -> list[LLMJudgment]:
         cleaned_text = self._strip_code_fence(payload_text)
         if not cleaned_text:
@@ -372,17 +709,10 @@ class LLMRelevanceJudge:
         if not payload_text:
             return ""
 
-        stripped = payload_text.strip()
-        if not stripped.startswith("```"):
-            return stripped
-
-        # Remove first fence line that may contain a language identifier.
-        lines = stripped.splitlines()
-        if len(lines) >= 2 and lines[0].startswith("```"):
-            lines = lines[1:]
-        if lines and lines[-1].strip().startswith("```"):
-            lines = lines[:-1]
-        return "\n".join(lines).strip()
+        match = _FENCE_RE.match(payload_text)
+        if match:
+            return match.group(1).strip()
+        return payload_text.strip()
 
     @staticmethod
     def _extract_judgment(entry: object) -> LLMJudgment:
@@ -420,6 +750,10 @@ def main(argv: Iterable[str] | None = None) -> None:
 
     if args.limit < 1:
         parser.error("--limit must be >= 1")
+    if bool(args.query) == bool(args.queries_file):
+        parser.error("provide either a query or --queries-file, not both")
+    if args.queries_file and (args.advanced or args.to_file):
+        parser.error("--queries-file cannot be combined with --advanced or --to-file")
     if args.separating_lines < 0:
         parser.error("--separating-lines must be >= 0")
     if args.separating_char is not None:
@@ -428,6 +762,34 @@ def main(argv: Iterable[str] | None = None) -> None:
         if args.separating_char.isspace():
             parser.error("--separating-char cannot be whitespace")
 
+    if args.queries_file:
+        try:
+            lines = Path(args.queries_file).read_text(encoding="utf-8").splitlines()
+        except OSError as exc:
+            LOGGER.error("Unable to read %s: %s", args.queries_file, exc)
+            raise SystemExit(1) from exc
+
+        queries = [line.strip() for line in lines if line.strip()]
+        if not queries:
+            parser.error("--queries-file contains no queries")
+
+        try:
+            per_query_results = search_many(queries, limit=args.limit)
+        except Exception as exc:
+            LOGGER.error("Search failed: %s", exc)
+            raise SystemExit(1) from exc
+
+        for query, query_results in zip(queries, per_query_results):
+            print(f"Query: {query}")
+            if not query_results:
+                print("   No matches found")
+                print()
+                continue
+            for index, result in enumerate(query_results, start=1):
+                print(format_result(SearchOutput(chunk=result), index))
+                print()
+        return
+
     try:
         if args.advanced:
             advanced_results = advanced_search(args.query, limit=args.limit)
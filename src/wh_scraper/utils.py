@@ -2,14 +2,18 @@
 
 from __future__ import annotations
 
+import functools
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import date, datetime
-from typing import Optional
+from typing import Optional, Sequence
 
 import requests
-from bs4 import BeautifulSoup
 from dateutil import parser as date_parser
+from lxml.html import HtmlElement
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from .config import SETTINGS
 
@@ -21,50 +25,167 @@ USER_AGENT = (
 )
 
 
+def _build_session() -> requests.Session:
+    """Build the shared session: pooled keep-alive connections, gzip, retries."""
+
+    session = requests.Session()
+    retry = Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=(429, 500, 502, 503, 504),
+    )
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update(
+        {
+            "User-Agent": USER_AGENT,
+            "Accept-Encoding": "gzip, deflate",
+        }
+    )
+    return session
+
+
+SESSION = _build_session()
+
+
 def fetch_html(url: str, *, session: Optional[requests.Session] = None) -> str:
     """Fetch a URL using a short polite delay and return the HTML text."""
 
     LOGGER.debug("Fetching %s", url)
     time.sleep(max(SETTINGS.request_delay, 0))
 
-    sess = session or requests.Session()
+    sess = session or SESSION
     headers = {"User-Agent": USER_AGENT}
     response = sess.get(url, headers=headers, timeout=SETTINGS.request_timeout)
     response.raise_for_status()
     return response.text
 
 
+def fetch_html_conditional(
+    url: str,
+    *,
+    session: Optional[requests.Session] = None,
+    etag: Optional[str] = None,
+    last_modified: Optional[str] = None,
+) -> tuple[Optional[bytes], Optional[str], Optional[str]]:
+    """Conditional GET: returns `(body, etag, last_modified)`.
+
+    When stored validators are supplied and the server answers 304, the
+    body is None and the validators are returned unchanged — no bytes of
+    page content cross the wire.
+    """
+
+    LOGGER.debug("Fetching %s", url)
+    time.sleep(max(SETTINGS.request_delay, 0))
+
+    sess = session or SESSION
+    headers = {"User-Agent": USER_AGENT}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+
+    response = sess.get(url, headers=headers, timeout=SETTINGS.request_timeout)
+    if response.status_code == 304:
+        return None, etag, last_modified
+    response.raise_for_status()
+    return (
+        response.content,
+        response.headers.get("ETag"),
+        response.headers.get("Last-Modified"),
+    )
+
+
+def fetch_html_many(
+    urls: Sequence[str],
+    *,
+    concurrency: int = 8,
+    session: Optional[requests.Session] = None,
+) -> dict[str, str]:
+    """Fetch several URLs concurrently over the pooled keep-alive session.
+
+    Returns a mapping of URL to HTML for the fetches that succeeded;
+    failures are logged and omitted so one bad URL doesn't sink the batch.
+    """
+
+    results: dict[str, str] = {}
+    if not urls:
+        return results
+
+    sess = session or SESSION
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        futures = {
+            executor.submit(fetch_html, url, session=sess): url for url in urls
+        }
+        for future in as_completed(futures):
+            url = futures[future]
+            try:
+                results[url] = future.result()
+            except requests.RequestException as exc:
+                LOGGER.error("Failed to fetch %s: %s", url, exc)
+
+    return results
+
+
+# One reusable parser instance: dateutil otherwise builds a fresh
+# parserinfo on every call through the module-level parse().
+_DATE_PARSER = date_parser.parser()
+
+
+@functools.lru_cache(maxsize=4096)
 def parse_date(value: Optional[str]) -> Optional[date]:
+    """Parse a date string, caching results since listing pages repeat dates.
+
+    ISO-8601 values (the common case in transcript metadata) take the
+    fromisoformat fast path; everything else falls back to dateutil.
+    """
+
     if not value:
         return None
 
+    cleaned = value.strip()
     try:
-        parsed = date_parser.parse(value)
+        return date.fromisoformat(cleaned[:10])
+    except ValueError:
+        pass
+
+    try:
+        parsed = _DATE_PARSER.parse(cleaned)
         return parsed.date()
     except (ValueError, OverflowError):
         LOGGER.debug("Unable to parse date from value: %s", value)
         return None
 
 
+@functools.lru_cache(maxsize=4096)
 def parse_datetime(value: Optional[str]) -> Optional[datetime]:
     if not value:
         return None
 
+    cleaned = value.strip()
+    try:
+        return datetime.fromisoformat(cleaned)
+    except ValueError:
+        pass
+
     try:
-        return date_parser.parse(value)
+        return _DATE_PARSER.parse(cleaned)
     except (ValueError, OverflowError):
         LOGGER.debug("Unable to parse datetime from value: %s", value)
         return None
 
 
-def extract_clean_text(container: BeautifulSoup) -> str:
-    """Convert a soup container into a lightly formatted plain-text block."""
+_BLOCK_TAGS = ("p", "blockquote", "li", "h2", "h3")
+
+
+def extract_clean_text(container: HtmlElement) -> str:
+    """Convert an lxml container into a lightly formatted plain-text block."""
 
     pieces = []
-    block_tags = ["p", "blockquote", "li", "h2", "h3"]
 
-    for tag in container.find_all(block_tags):
-        text = tag.get_text(" ", strip=True)
+    for tag in container.iter(*_BLOCK_TAGS):
+        text = " ".join(tag.text_content().split())
         if text:
             pieces.append(text)
 
@@ -2,12 +2,22 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import hashlib
 import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Iterable, List, Sequence
+from pathlib import Path
+from typing import Iterable, List, Optional, Sequence
 
+import numpy as np
 import tiktoken
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 
 from .config import SETTINGS
 
@@ -15,18 +25,41 @@ from .config import SETTINGS
 LOGGER = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=8)
+def _get_encoding(name: str) -> tiktoken.Encoding:
+    """Load a tiktoken encoding once per process.
+
+    get_encoding builds the BPE merge table from disk on every call;
+    Encoding objects are thread-safe for encode/decode, so sharing one
+    across chunkers and the embed packer is free.
+    """
+
+    return tiktoken.get_encoding(name)
+
+
 @dataclass
 class EmbeddingBatch:
-    """Holds a batch of embeddings."""
+    """Holds a batch of embeddings as one packed float32 matrix.
+
+    `vectors` has shape `(n, dimensions)`; a row per input text, in
+    input order. Packed float32 is ~9x smaller than lists of Python
+    floats and feeds BLAS and the pgvector adapter without conversion.
+    """
 
     model: str
     dimensions: int
-    vectors: List[Sequence[float]]
+    vectors: np.ndarray
+
+
+def _empty_vectors() -> np.ndarray:
+    return np.empty((0, 0), dtype=np.float32)
 
 
 class TextChunker:
     """Token-aware chunker that builds overlapping windows."""
 
+    TOKEN_CACHE_SIZE = 512
+
     def __init__(
         self,
         *,
@@ -43,26 +76,111 @@ class TextChunker:
 
         self.max_tokens = max_tokens
         self.overlap_tokens = overlap_tokens
-        self.encoding = tiktoken.get_encoding(encoding_name)
+        self.encoding = _get_encoding(encoding_name)
+        self._token_cache: OrderedDict[str, List[int]] = OrderedDict()
+
+    def _encode(self, text: str) -> List[int]:
+        """Tokenize `text`, caching results keyed by content hash.
+
+        The cache is keyed on a sha1 digest rather than the raw text so
+        repeated re-chunking of the same documents skips BPE without
+        pinning full transcripts in memory.
+        """
+
+        digest = hashlib.sha1(text.encode("utf-8")).hexdigest()
+        cached = self._token_cache.get(digest)
+        if cached is not None:
+            self._token_cache.move_to_end(digest)
+            return cached
+
+        token_ids = self.encoding.encode(text)
+        self._token_cache[digest] = token_ids
+        if len(self._token_cache) > self.TOKEN_CACHE_SIZE:
+            self._token_cache.popitem(last=False)
+        return token_ids
 
     def chunk_text(self, text: str) -> List[str]:
         stripped = text.strip()
         if not stripped:
             return []
+        return [chunk for chunk, _ in self._chunks_from_tokens(self._encode(stripped), stripped)]
+
+    def chunk_text_with_counts(self, text: str) -> List[tuple[str, int]]:
+        """Like `chunk_text` but pair each chunk with its token count.
+
+        The counts fall out of the window slicing for free; passing them
+        to the embedding client's token-budget packer saves it a second
+        BPE pass over every chunk.
+        """
+
+        stripped = text.strip()
+        if not stripped:
+            return []
+        return self._chunks_from_tokens(self._encode(stripped), stripped)
+
+    def chunk_texts(self, texts: Sequence[str]) -> List[List[str]]:
+        """Chunk several texts at once, batching BPE through the Rust core.
+
+        encode_ordinary_batch releases the GIL and parallelizes across
+        texts, so the encode step scales with core count; only the cheap
+        window slicing runs per document in Python. Returns one chunk
+        list per input text, in input order.
+        """
+
+        stripped_texts = [text.strip() for text in texts]
+
+        # Repeated texts (reposted briefings, shared boilerplate pages)
+        # hit the same digest-keyed token cache chunk_text uses, so only
+        # genuinely new content goes through BPE.
+        token_lists: List[Optional[List[int]]] = [None] * len(stripped_texts)
+        miss_indices: List[int] = []
+        for index, stripped in enumerate(stripped_texts):
+            digest = hashlib.sha1(stripped.encode("utf-8")).hexdigest()
+            cached = self._token_cache.get(digest)
+            if cached is not None:
+                self._token_cache.move_to_end(digest)
+                token_lists[index] = cached
+            else:
+                miss_indices.append(index)
+
+        if miss_indices:
+            encoded = self.encoding.encode_ordinary_batch(
+                [stripped_texts[index] for index in miss_indices],
+                num_threads=os.cpu_count() or 1,
+            )
+            for index, token_ids in zip(miss_indices, encoded):
+                token_lists[index] = token_ids
+                digest = hashlib.sha1(
+                    stripped_texts[index].encode("utf-8")
+                ).hexdigest()
+                self._token_cache[digest] = token_ids
+                if len(self._token_cache) > self.TOKEN_CACHE_SIZE:
+                    self._token_cache.popitem(last=False)
+
+        return [
+            [chunk for chunk, _ in self._chunks_from_tokens(token_ids, stripped)]
+            for token_ids, stripped in zip(token_lists, stripped_texts)
+        ]
+
+    def _chunks_from_tokens(
+        self, token_ids: List[int], stripped: str
+    ) -> List[tuple[str, int]]:
+        """Slice encoded tokens into overlapping `(text, token_count)` windows.
+
+        The window bounds are computed in one Python pass, then all
+        windows decode in a single decode_batch call — one GIL-releasing
+        trip into the Rust core instead of one per window.
+        """
 
-        token_ids = self.encoding.encode(stripped)
         total_tokens = len(token_ids)
         if total_tokens <= self.max_tokens:
-            return [stripped]
+            return [(stripped, total_tokens)] if stripped else []
 
-        chunks: List[str] = []
+        windows: List[List[int]] = []
         start = 0
         while start < total_tokens:
             end = min(start + self.max_tokens, total_tokens)
-            chunk_tokens = token_ids[start:end]
-            chunk_text = self.encoding.decode(chunk_tokens).strip()
-            if chunk_text:
-                chunks.append(chunk_text)
+            windows.append(token_ids[start:end])
 
             if end == total_tokens:
                 break
@@ -77,18 +195,116 @@ class TextChunker:
             else:
                 start = end
 
-        return chunks
+        decoded = self.encoding.decode_batch(windows, num_threads=os.cpu_count() or 1)
+        return [
+            (text, len(window))
+            for window, piece in zip(windows, decoded)
+            if (text := piece.strip())
+        ]
+
+
+class EmbeddingCache:
+    """Persistent cache for query embeddings, keyed by (model, text hash).
+
+    Short search queries repeat heavily, and embedding one is a full API
+    round-trip. Hits are served from a small in-process LRU backed by a
+    sqlite table of float32 vectors with TTL-based eviction.
+    """
+
+    HOT_CACHE_SIZE = 256
+
+    def __init__(
+        self,
+        path: Path | None = None,
+        *,
+        ttl_seconds: float = 7 * 24 * 3600.0,
+    ) -> None:
+        if path is None:
+            path = Path(__file__).resolve().parents[2] / "cache" / "query_embeddings.db"
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS query_embeddings (
+                key TEXT PRIMARY KEY,
+                model TEXT NOT NULL,
+                vector BLOB NOT NULL,
+                ts REAL NOT NULL
+            )
+            """
+        )
+        self._conn.commit()
+        self._hot: OrderedDict[str, List[float]] = OrderedDict()
+
+    @staticmethod
+    def _key(model: str, text: str) -> str:
+        return hashlib.sha256(f"{model}:{text}".encode("utf-8")).hexdigest()
+
+    def get(self, model: str, text: str) -> Optional[List[float]]:
+        key = self._key(model, text)
+        with self._lock:
+            hot = self._hot.get(key)
+            if hot is not None:
+                self._hot.move_to_end(key)
+                return hot
+
+            row = self._conn.execute(
+                "SELECT vector, ts FROM query_embeddings WHERE key = ?", (key,)
+            ).fetchone()
+
+        if row is None:
+            return None
+        blob, ts = row
+        if time.time() - ts > self.ttl_seconds:
+            with self._lock:
+                self._conn.execute("DELETE FROM query_embeddings WHERE key = ?", (key,))
+                self._conn.commit()
+            return None
+
+        vector = np.frombuffer(blob, dtype=np.float32).tolist()
+        self._remember_hot(key, vector)
+        return vector
+
+    def put(self, model: str, text: str, vector: Sequence[float]) -> None:
+        key = self._key(model, text)
+        blob = np.asarray(vector, dtype=np.float32).tobytes()
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO query_embeddings (key, model, vector, ts)"
+                " VALUES (?, ?, ?, ?)",
+                (key, model, blob, now),
+            )
+            self._conn.execute(
+                "DELETE FROM query_embeddings WHERE ts < ?", (now - self.ttl_seconds,)
+            )
+            self._conn.commit()
+        self._remember_hot(key, list(vector))
+
+    def _remember_hot(self, key: str, vector: List[float]) -> None:
+        with self._lock:
+            self._hot[key] = vector
+            self._hot.move_to_end(key)
+            if len(self._hot) > self.HOT_CACHE_SIZE:
+                self._hot.popitem(last=False)
 
 
 class OpenAIEmbeddingClient:
     """Thin wrapper that batches embedding requests."""
 
+    # Input-token headroom per embeddings request (model accepts ~8191).
+    REQUEST_TOKEN_BUDGET = 8000
+
     def __init__(
         self,
         *,
         api_key: str | None = None,
         model: str | None = None,
         batch_size: int | None = None,
+        concurrency: int | None = None,
     ) -> None:
         key = api_key or SETTINGS.openai_api_key
         if not key:
@@ -96,28 +312,153 @@ class OpenAIEmbeddingClient:
 
         self.model = model or SETTINGS.openai_embedding_model
         self.batch_size = batch_size or SETTINGS.embedding_batch_size
+        self.concurrency = concurrency or SETTINGS.embedding_concurrency
         self.client = OpenAI(api_key=key)
+        self._api_key = key
+        self._async_client: AsyncOpenAI | None = None
+        self._async_client_loop: asyncio.AbstractEventLoop | None = None
+
+    def _get_async_client(self) -> AsyncOpenAI:
+        """Return an AsyncOpenAI client bound to the running event loop.
+
+        The client's connection pool belongs to the loop it first ran
+        under; callers that asyncio.run() per batch (the embed CLI, the
+        sync wrapper) close that loop, so reusing the old client would
+        fail with "Event loop is closed". Within one loop the client is
+        still shared.
+        """
+
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_client_loop is not loop:
+            self._async_client = AsyncOpenAI(api_key=self._api_key)
+            self._async_client_loop = loop
+        return self._async_client
 
     def embed_texts(self, texts: Sequence[str]) -> EmbeddingBatch:
         if not texts:
-            return EmbeddingBatch(model=self.model, dimensions=0, vectors=[])
+            return EmbeddingBatch(
+                model=self.model, dimensions=0, vectors=_empty_vectors()
+            )
 
         response = self.client.embeddings.create(model=self.model, input=list(texts))
         dimensions = len(response.data[0].embedding)
-        vectors = [record.embedding for record in response.data]
+        vectors = np.asarray(
+            [record.embedding for record in response.data], dtype=np.float32
+        )
         return EmbeddingBatch(model=self.model, dimensions=dimensions, vectors=vectors)
 
-    def embed_in_batches(self, texts: Sequence[str]) -> EmbeddingBatch:
-        vectors: List[Sequence[float]] = []
+    def embed_in_batches(
+        self,
+        texts: Sequence[str],
+        *,
+        token_counts: Optional[Sequence[int]] = None,
+    ) -> EmbeddingBatch:
+        """Synchronous entry point for batch embedding.
+
+        Delegates to the concurrent async path so callers without an
+        event loop still get `embedding_concurrency` batches in flight
+        instead of one HTTPS round trip at a time.
+        """
+
         if not texts:
-            return EmbeddingBatch(model=self.model, dimensions=0, vectors=vectors)
+            return EmbeddingBatch(
+                model=self.model, dimensions=0, vectors=_empty_vectors()
+            )
+
+        return asyncio.run(
+            self.embed_in_batches_async(texts, token_counts=token_counts)
+        )
+
+    async def embed_batch_async(self, texts: Sequence[str]) -> EmbeddingBatch:
+        response = await self._get_async_client().embeddings.create(
+            model=self.model, input=list(texts)
+        )
+        dimensions = len(response.data[0].embedding)
+        vectors = np.asarray(
+            [record.embedding for record in response.data], dtype=np.float32
+        )
+        return EmbeddingBatch(model=self.model, dimensions=dimensions, vectors=vectors)
+
+    def _pack_batches(
+        self,
+        texts: Sequence[str],
+        token_counts: Optional[Sequence[int]] = None,
+    ) -> List[List[str]]:
+        """Greedily pack texts into requests by token count.
+
+        A fixed count per request wastes the token budget on short
+        chunks and risks blowing it on long ones; packing to the budget
+        minimizes round trips. `batch_size` stays as a hard cap on
+        inputs per request. Callers that already tokenized (the chunker
+        knows each window's length) pass `token_counts` to skip the BPE
+        pass here.
+        """
+
+        encoding = None if token_counts is not None else _get_encoding("cl100k_base")
+        batches: List[List[str]] = []
+        current: List[str] = []
+        running_tokens = 0
+        total_tokens = 0
+
+        for index, text in enumerate(texts):
+            if token_counts is not None:
+                tokens = token_counts[index]
+            else:
+                tokens = len(encoding.encode_ordinary(text))
+            total_tokens += tokens
+            if current and (
+                running_tokens + tokens > self.REQUEST_TOKEN_BUDGET
+                or len(current) >= self.batch_size
+            ):
+                batches.append(current)
+                current = []
+                running_tokens = 0
+            current.append(text)
+            running_tokens += tokens
+
+        if current:
+            batches.append(current)
+        LOGGER.debug(
+            "Packed %d texts into %d requests (%.0f tokens/request avg)",
+            len(texts),
+            len(batches),
+            total_tokens / len(batches) if batches else 0,
+        )
+        return batches
+
+    async def embed_in_batches_async(
+        self,
+        texts: Sequence[str],
+        *,
+        token_counts: Optional[Sequence[int]] = None,
+    ) -> EmbeddingBatch:
+        """Embed batches concurrently; results keep the caller's text order."""
+
+        if not texts:
+            return EmbeddingBatch(
+                model=self.model, dimensions=0, vectors=_empty_vectors()
+            )
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def embed_one(batch: Sequence[str]) -> EmbeddingBatch:
+            async with semaphore:
+                return await self.embed_batch_async(batch)
+
+        batches = self._pack_batches(texts, token_counts)
+        results = await asyncio.gather(*(embed_one(batch) for batch in batches))
 
-        dimensions = 0
-        for start in range(0, len(texts), self.batch_size):
-            batch = texts[start : start + self.batch_size]
-            batch_result = self.embed_texts(batch)
-            dimensions = batch_result.dimensions
-            vectors.extend(batch_result.vectors)
-            LOGGER.info("Embedded %d texts (total %d/%d)", len(batch), len(vectors), len(texts))
+        # The output size is known up front, so fill one preallocated
+        # matrix instead of concatenating per-request arrays into a copy.
+        dimensions = results[-1].dimensions
+        vectors = np.empty((len(texts), dimensions), dtype=np.float32)
+        offset = 0
+        for result in results:
+            rows = result.vectors
+            vectors[offset : offset + len(rows)] = rows
+            offset += len(rows)
 
+        LOGGER.info(
+            "Embedded %d texts in %d concurrent batches", len(vectors), len(batches)
+        )
         return EmbeddingBatch(model=self.model, dimensions=dimensions, vectors=vectors)
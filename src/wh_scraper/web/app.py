@@ -3,11 +3,16 @@
 from __future__ import annotations
 
 import math
+import threading
 import time
+from collections import OrderedDict
 from datetime import date
 from typing import Sequence
 
-from flask import Flask, abort, jsonify, render_template, request
+import numpy as np
+import orjson
+from flask import Flask, Response, abort, request, stream_template
+from jinja2 import FileSystemBytecodeCache
 
 from ..config import SETTINGS
 from ..models import DocumentDetail, DocumentRepository, SearchResult
@@ -19,6 +24,14 @@ MAX_QUERY_LENGTH = 200
 MAX_SEARCH_RESULTS = 250
 ALLOWED_SORTS = {"relevance", "date_desc", "date_asc"}
 
+# Paging through results re-posts the same query; cache the full sorted
+# list per (query, filter, sort) so later pages slice instead of
+# re-embedding and re-searching.
+_SEARCH_CACHE_TTL_SECONDS = 300.0
+_SEARCH_CACHE_MAX_ENTRIES = 512
+_SEARCH_CACHE: OrderedDict[tuple, tuple[float, list[SearchResult]]] = OrderedDict()
+_SEARCH_CACHE_LOCK = threading.Lock()
+
 
 def _advanced_available() -> bool:
     return bool(SETTINGS.openai_api_key)
@@ -30,39 +43,77 @@ def _sanitize_admin_filter(raw_value) -> list[str] | None:
 
     if isinstance(raw_value, str):
         candidates = [raw_value]
-    elif isinstance(raw_value, Sequence):
+    elif isinstance(raw_value, (list, tuple)):
         candidates = list(raw_value)
     else:
         raise ValueError("admin_filter must be a list of strings")
 
-    cleaned = []
-    for value in candidates:
-        text = str(value).strip()
-        if text and text not in cleaned:
-            cleaned.append(text)
+    # dict.fromkeys dedupes in one O(n) pass while keeping first-seen order.
+    cleaned = list(
+        dict.fromkeys(
+            text for text in (str(value).strip() for value in candidates) if text
+        )
+    )
     return cleaned or None
 
 
 def _sort_results(results: Sequence[SearchResult], sort_key: str) -> list[SearchResult]:
-    if sort_key == "relevance":
+    if sort_key == "relevance" or len(results) < 2:
         return list(results)
 
-    reverse = sort_key == "date_desc"
-
-    def sort_value(result: SearchResult) -> tuple[date, int]:
-        published = result.date_published or date.min
-        return (published, result.document_id)
-
-    return sorted(results, key=sort_value, reverse=reverse)
-
-
-def _similarity(distance: float) -> float:
-    similarity = 1.0 - distance
-    if similarity < 0:
-        return 0.0
-    if similarity > 1:
-        return 1.0
-    return similarity
+    # lexsort over preconverted arrays keeps the comparisons in C rather
+    # than calling a Python key function per element.
+    count = len(results)
+    dates = np.fromiter(
+        ((result.date_published or date.min).toordinal() for result in results),
+        dtype=np.int32,
+        count=count,
+    )
+    ids = np.fromiter(
+        (result.document_id for result in results), dtype=np.int64, count=count
+    )
+    order = np.lexsort((ids, dates))
+    if sort_key == "date_desc":
+        order = order[::-1]
+    return [results[index] for index in order]
+
+
+def _cached_sorted_search(
+    query: str,
+    admin_filter: list[str] | None,
+    sort: str,
+) -> list[SearchResult]:
+    key = (query.lower(), tuple(admin_filter or ()), sort)
+    now = time.monotonic()
+    with _SEARCH_CACHE_LOCK:
+        entry = _SEARCH_CACHE.get(key)
+        if entry is not None and now - entry[0] < _SEARCH_CACHE_TTL_SECONDS:
+            _SEARCH_CACHE.move_to_end(key)
+            return entry[1]
+
+    results = _sort_results(
+        semantic_search(query, limit=MAX_SEARCH_RESULTS, admin_filter=admin_filter),
+        sort,
+    )
+    with _SEARCH_CACHE_LOCK:
+        _SEARCH_CACHE[key] = (now, results)
+        _SEARCH_CACHE.move_to_end(key)
+        while len(_SEARCH_CACHE) > _SEARCH_CACHE_MAX_ENTRIES:
+            _SEARCH_CACHE.popitem(last=False)
+    return results
+
+
+def _json_response(payload: dict, status: int = 200) -> Response:
+    """Serialize API payloads with orjson instead of stdlib json.
+
+    orjson is several times faster than jsonify's encoder and writes
+    date/datetime values natively, so serializers can pass them through
+    unconverted.
+    """
+
+    return Response(
+        orjson.dumps(payload), status=status, mimetype="application/json"
+    )
 
 
 def _serialize_search_result(
@@ -72,14 +123,16 @@ def _serialize_search_result(
     verdict_explanation: str | None = None,
     verdict_valid: bool = False,
 ) -> dict:
-    similarity = _similarity(result.score)
+    # Scores arrive from SQL as cosine similarities; clamp floating-point
+    # noise into [0, 1] for display without a branch per bound.
+    similarity = min(1.0, max(0.0, result.score))
     payload = {
         "chunk_id": result.chunk_id,
         "document_id": result.document_id,
         "chunk_index": result.chunk_index,
         "title": result.title or "Untitled briefing",
         "admin": result.admin,
-        "publish_date": result.date_published.isoformat() if result.date_published else None,
+        "publish_date": result.date_published_iso,
         "source_url": result.url,
         "chunk": result.text,
         "cosine_score": similarity,
@@ -90,6 +143,34 @@ def _serialize_search_result(
     return payload
 
 
+def _serialize_many(results: Sequence[SearchResult]) -> list[dict]:
+    """Serialize a page of plain (non-judged) results in one tight pass.
+
+    Builtins are bound to locals and the dict literal compiles to a
+    single constant-keys opcode, so the per-item cost is just the
+    attribute loads.
+    """
+
+    _min, _max = min, max
+    return [
+        {
+            "chunk_id": result.chunk_id,
+            "document_id": result.document_id,
+            "chunk_index": result.chunk_index,
+            "title": result.title or "Untitled briefing",
+            "admin": result.admin,
+            "publish_date": result.date_published_iso,
+            "source_url": result.url,
+            "chunk": result.text,
+            "cosine_score": _min(1.0, _max(0.0, result.score)),
+            "verdict": None,
+            "verdict_reason": None,
+            "rejected": False,
+        }
+        for result in results
+    ]
+
+
 def _serialize_detail(detail: DocumentDetail) -> dict:
     """Convert a DocumentDetail dataclass into JSON-serializable payload."""
 
@@ -98,10 +179,8 @@ def _serialize_detail(detail: DocumentDetail) -> dict:
         "admin": detail.admin,
         "title": detail.title,
         "url": detail.url,
-        "date_published": detail.date_published.isoformat() if detail.date_published else None,
-        "datetime_published": detail.datetime_published.isoformat()
-        if detail.datetime_published
-        else None,
+        "date_published": detail.date_published,
+        "datetime_published": detail.datetime_published,
         "location": detail.location,
         "clean_text": detail.clean_text,
         "scrape_status": detail.scrape_status,
@@ -110,28 +189,32 @@ def _serialize_detail(detail: DocumentDetail) -> dict:
 
 def create_app() -> Flask:
     app = Flask(__name__, template_folder="templates", static_folder="static")
+    # Compile each template once per process and persist the bytecode so
+    # even cold workers skip Jinja's parse step; streaming the render
+    # overlaps template evaluation with the socket write.
+    app.jinja_env.auto_reload = False
+    app.jinja_env.bytecode_cache = FileSystemBytecodeCache()
     repo = DocumentRepository()
 
     @app.get("/")
-    def documents() -> str:
+    def documents():
         admin_filter = request.args.get("admin") or None
         status_filter = request.args.get("status") or None
         page = max(int(request.args.get("page", "1") or 1), 1)
         offset = (page - 1) * PAGE_SIZE
 
-        documents = repo.list_documents(
+        documents, total_count = repo.list_documents_with_count(
             admin=admin_filter,
             scrape_status=status_filter,
             limit=PAGE_SIZE,
             offset=offset,
         )
-        total_count = repo.count_documents(admin=admin_filter, scrape_status=status_filter)
         total_pages = max(1, math.ceil(total_count / PAGE_SIZE)) if total_count else 1
 
         admins = repo.list_admins()
         statuses = repo.list_statuses()
 
-        return render_template(
+        return stream_template(
             "documents.html",
             documents=documents,
             admin_filter=admin_filter,
@@ -146,9 +229,9 @@ def create_app() -> Flask:
         )
 
     @app.get("/search")
-    def search_page() -> str:
+    def search_page():
         admins = repo.list_admins()
-        return render_template(
+        return stream_template(
             "search.html",
             admins=admins,
             page_size=PAGE_SIZE,
@@ -161,29 +244,29 @@ def create_app() -> Flask:
         detail = repo.get_document(document_id)
         if not detail:
             abort(404)
-        return jsonify(_serialize_detail(detail))
+        return _json_response(_serialize_detail(detail))
 
     @app.post("/api/search")
     def api_search():
         payload = request.get_json(silent=True) or {}
         query = (payload.get("query") or "").strip()
         if not query:
-            return jsonify({"error": "Query cannot be empty."}), 400
+            return _json_response({"error": "Query cannot be empty."}, status=400)
         if len(query) > MAX_QUERY_LENGTH:
-            return jsonify({"error": "Query must be 200 characters or fewer."}), 400
+            return _json_response({"error": "Query must be 200 characters or fewer."}, status=400)
 
         mode = (payload.get("mode") or "simple").lower()
         if mode not in {"simple", "advanced"}:
-            return jsonify({"error": "Mode must be 'simple' or 'advanced'."}), 400
+            return _json_response({"error": "Mode must be 'simple' or 'advanced'."}, status=400)
 
         sort = (payload.get("sort") or "relevance").lower()
         if sort not in ALLOWED_SORTS:
-            return jsonify({"error": "Unsupported sort order."}), 400
+            return _json_response({"error": "Unsupported sort order."}, status=400)
 
         try:
             admin_filter = _sanitize_admin_filter(payload.get("admin_filter"))
         except ValueError as exc:  # pragma: no cover - validation guard
-            return jsonify({"error": str(exc)}), 400
+            return _json_response({"error": str(exc)}, status=400)
 
         page_size = int(payload.get("page_size") or PAGE_SIZE)
         page_size = min(max(page_size, 1), PAGE_SIZE)
@@ -192,26 +275,21 @@ def create_app() -> Flask:
 
         advanced_available = _advanced_available()
         if mode == "advanced" and not advanced_available:
-            return jsonify({"error": "Advanced search is not available right now."}), 503
+            return _json_response({"error": "Advanced search is not available right now."}, status=503)
 
         start_time = time.perf_counter()
         try:
-            raw_results = semantic_search(
-                query,
-                limit=MAX_SEARCH_RESULTS,
-                admin_filter=admin_filter,
-            )
+            sorted_results = _cached_sorted_search(query, admin_filter, sort)
         except RuntimeError as exc:
             app.logger.exception("Search unavailable: %s", exc)
-            return (
-                jsonify({"error": "Search is temporarily unavailable. Please try again later."}),
-                503,
+            return _json_response(
+                {"error": "Search is temporarily unavailable. Please try again later."},
+                status=503,
             )
         except Exception as exc:  # pragma: no cover - defensive logging
             app.logger.exception("Search failed: %s", exc)
-            return jsonify({"error": "Something went wrong while searching. Please try again."}), 500
+            return _json_response({"error": "Something went wrong while searching. Please try again."}, status=500)
 
-        sorted_results = _sort_results(raw_results, sort)
         total_results = len(sorted_results)
         total_pages = math.ceil(total_results / page_size) if total_results else 0
 
@@ -237,7 +315,7 @@ def create_app() -> Flask:
                 for result in enriched
             ]
         else:
-            results_payload = [_serialize_search_result(result) for result in page_items]
+            results_payload = _serialize_many(page_items)
 
         elapsed_ms = int((time.perf_counter() - start_time) * 1000)
 
@@ -259,6 +337,6 @@ def create_app() -> Flask:
             "results": results_payload,
             "metadata": {"query_length": len(query), "elapsed_ms": elapsed_ms},
         }
-        return jsonify(response)
+        return _json_response(response)
 
     return app
@@ -0,0 +1,5 @@
+"""WSGI entry point for production servers (gunicorn, uwsgi)."""
+
+from .app import create_app
+
+app = create_app()